@@ -2,6 +2,56 @@
 myproject - Python project template
 
 프로젝트 이름을 실제 프로젝트명으로 변경하세요.
+
+공개 API는 _LAZY_EXPORTS에 선언합니다. 선언된 이름은 처음 접근할 때 import되므로 (PEP 562)
+`import myproject`만으로는 하위 모듈과 서드파티 의존성을 불러오지 않습니다 (CLI/워커 시작 시간 단축).
+import 시간 예산은 tests/unit/test_myproject/test_import_time.py에서 검사합니다.
 """
 
+from __future__ import annotations
+
+import importlib
+
+# typing 모듈 import 비용(수 ms)을 피하기 위해 typing.TYPE_CHECKING 대신 사용 (mypy도 인식)
+TYPE_CHECKING = False
+
 __version__ = "0.1.0"
+
+# 공개 이름 -> (모듈 경로, 속성 이름), 속성 이름이 None이면 모듈 자체를 노출
+_LAZY_EXPORTS: dict[str, tuple[str, str | None]] = {
+    "LinearClient": ("myproject.linear", "LinearClient"),
+    "LinearAPIError": ("myproject.linear", "LinearAPIError"),
+    "configure_logging": ("myproject.log", "configure_logging"),
+    "shutdown_logging": ("myproject.log", "shutdown_logging"),
+    # "utils": ("myproject.utils", None),
+}
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    # mypy/IDE용: _LAZY_EXPORTS와 같은 이름을 여기서 import하면 지연 로딩 이름도 타입 검사됨
+    # __all__을 ruff가 해석하지 못하므로 "X as X" 형태로 재노출 (F401로 삭제되지 않도록)
+    # from myproject import utils as utils
+    from myproject.linear import LinearAPIError as LinearAPIError
+    from myproject.linear import LinearClient as LinearClient
+    from myproject.log import configure_logging as configure_logging
+    from myproject.log import shutdown_logging as shutdown_logging
+
+__all__ = ["__version__", *_LAZY_EXPORTS]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    module = importlib.import_module(module_name)
+    value = module if attribute is None else getattr(module, attribute)
+    # 다음 접근부터는 __getattr__를 거치지 않도록 캐시
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_EXPORTS})
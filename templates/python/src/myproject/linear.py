@@ -0,0 +1,475 @@
+"""
+Linear GraphQL API 비동기 클라이언트
+
+- 모든 요청이 하나의 httpx.AsyncClient 연결 풀을 공유 (keep-alive 연결 재사용)
+- 여러 쿼리/뮤테이션을 alias로 묶어 한 번의 요청으로 전송 (batch)
+- cursor 기반 페이지네이션을 async iterator로 스트리밍 (현재 페이지를 처리하는 동안 다음 페이지 요청)
+- token bucket으로 Linear rate limit 준수 (응답 헤더의 남은 요청 수로 동기화, 429/RATELIMITED 재시도)
+- 502/503/504는 query만 재시도 (뮤테이션은 서버에서 이미 반영됐을 수 있어 중복 생성 방지)
+
+사용법:
+    async with LinearClient() as client:  # LINEAR_API_KEY 환경 변수 사용
+        issues = await client.list_issues(filter={"state": {"type": {"eq": "completed"}}}, limit=50)
+        await client.create_document(title="Release Notes", content=render(issues))
+
+로컬 stub 서버나 VCR cassette로 테스트할 때는 url= 또는 transport=를 지정한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import re
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+LINEAR_API_URL = "https://api.linear.app/graphql"
+
+# 시간당 요청 수 (docs/linear-api-integration.md "API 제한사항")
+API_KEY_REQUESTS_PER_HOUR = 1500
+OAUTH_REQUESTS_PER_HOUR = 500
+
+# 한 요청에 묶는 최대 필드 수 - 요청당 query complexity 제한을 넘지 않도록
+DEFAULT_MAX_BATCH_SIZE = 20
+# connection 한 페이지의 최대 크기 (Linear 서버 제한)
+MAX_PAGE_SIZE = 250
+# 재시도 대기 시간 상한 (초)
+MAX_RETRY_DELAY = 60.0
+
+_VARIABLE_RE = re.compile(r"\$([_A-Za-z][_0-9A-Za-z]*)")
+# 게이트웨이 오류 - 서버에서 이미 실행됐을 수 있으므로 query만 재시도 (뮤테이션은 429/RATELIMITED만)
+_RETRY_STATUS = frozenset({502, 503, 504})
+_MUTATION_RE = re.compile(r"^\s*(?:#[^\n]*\n\s*)*mutation\b")
+
+ISSUE_FIELDS = "id identifier title url priority completedAt state { name type }"
+DOCUMENT_FIELDS = "id title url updatedAt"
+
+
+class LinearAPIError(Exception):
+    """HTTP 오류 또는 GraphQL errors 응답"""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        status_code: int | None = None,
+        errors: Sequence[Mapping[str, Any]] = (),
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.errors = list(errors)
+
+    @property
+    def rate_limited(self) -> bool:
+        return self.status_code == 429 or _is_rate_limited(self.errors)
+
+
+def _is_rate_limited(errors: Sequence[Mapping[str, Any]]) -> bool:
+    return any((error.get("extensions") or {}).get("code") == "RATELIMITED" for error in errors)
+
+
+class TokenBucket:
+    """
+    비동기 token bucket rate limiter
+
+    최대 capacity개까지 바로 사용할 수 있고 초당 rate개씩 다시 채워진다.
+    토큰이 부족하면 채워질 때까지 기다린다 (대기 순서는 FIFO).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def per_hour(cls, requests: int, **kwargs: Any) -> TokenBucket:
+        """시간당 requests회 제한 (Linear는 시간 단위 leaky bucket으로 계산)"""
+        return cls(rate=requests / 3600, capacity=requests, **kwargs)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+    async def acquire(self, tokens: float = 1) -> None:
+        if tokens > self.capacity:
+            raise ValueError(f"cannot acquire {tokens} tokens (capacity {self.capacity})")
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                await self._sleep((tokens - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= tokens
+
+    def sync(self, remaining: float) -> None:
+        """서버가 알려준 남은 요청 수가 더 적으면 맞춤 (다른 클라이언트/프로세스와 한도를 공유하는 경우)"""
+        self._refill()
+        self._tokens = min(self._tokens, max(float(remaining), 0.0))
+
+    def pause(self, seconds: float) -> None:
+        """seconds 동안 토큰을 내주지 않음 (다음 토큰이 seconds 뒤에 채워지도록 남은 토큰을 줄임)"""
+        self._refill()
+        self._tokens = min(self._tokens, 1 - max(seconds, 0.0) * self.rate)
+
+
+@dataclass(frozen=True)
+class Selection:
+    """
+    batch로 묶을 최상위 필드 하나
+
+    query: alias 없는 필드 선택 (예: 'issue(id: $id) { id title }')
+    variables: 변수 이름 -> (GraphQL 타입, 값) (예: {"id": ("String!", "ENG-1")})
+    """
+
+    query: str
+    variables: Mapping[str, tuple[str, Any]] = field(default_factory=dict)
+
+
+def build_batch(operation: str, selections: Sequence[Selection]) -> tuple[str, dict[str, Any]]:
+    """
+    여러 Selection을 하나의 GraphQL 문서로 합침
+
+    i번째 필드는 alias `b{i}`로, 변수는 `$b{i}_{name}`으로 이름을 바꿔 충돌을 막는다.
+    (문서, variables)를 반환한다.
+    """
+    definitions = []
+    fields = []
+    values: dict[str, Any] = {}
+    for index, selection in enumerate(selections):
+        alias = f"b{index}"
+
+        def rename(
+            match: re.Match[str], alias: str = alias, selection: Selection = selection
+        ) -> str:
+            name = match.group(1)
+            if name not in selection.variables:
+                raise ValueError(f"undeclared variable ${name} in {selection.query!r}")
+            return f"${alias}_{name}"
+
+        fields.append(f"{alias}: {_VARIABLE_RE.sub(rename, selection.query.strip())}")
+        for name, (graphql_type, value) in selection.variables.items():
+            definitions.append(f"${alias}_{name}: {graphql_type}")
+            values[f"{alias}_{name}"] = value
+
+    signature = f"({', '.join(definitions)})" if definitions else ""
+    body = "\n  ".join(fields)
+    return f"{operation} Batch{signature} {{\n  {body}\n}}", values
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Retry-After / X-RateLimit-Requests-Reset(epoch ms) 헤더, 없으면 지수 백오프 + jitter"""
+    retry_after = response.headers.get("retry-after")
+    reset = response.headers.get("x-ratelimit-requests-reset")
+    try:
+        if retry_after is not None:
+            delay = float(retry_after)
+        elif reset is not None:
+            delay = float(reset) / 1000 - time.time()
+        else:
+            delay = 2**attempt + random.random()
+    except ValueError:
+        delay = 2**attempt + random.random()
+    return min(max(delay, 0.0), MAX_RETRY_DELAY)
+
+
+def _graphql_error(
+    errors: Sequence[Mapping[str, Any]], status_code: int | None = None
+) -> LinearAPIError:
+    message = "; ".join(str(error.get("message")) for error in errors)
+    return LinearAPIError(f"GraphQL errors: {message}", status_code=status_code, errors=errors)
+
+
+class LinearClient:
+    """
+    Linear GraphQL API 비동기 클라이언트
+
+    async with로 사용하거나 종료 시 aclose()를 호출한다. 같은 인스턴스를 여러 task가
+    동시에 사용해도 연결 풀과 rate limiter를 공유한다.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        *,
+        url: str = LINEAR_API_URL,
+        rate_limiter: TokenBucket | None = None,
+        max_connections: int = 10,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_retries: int = 3,
+        timeout: float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        api_key = api_key or os.getenv("LINEAR_API_KEY")
+        if not api_key:
+            raise ValueError("LINEAR_API_KEY not found in environment variables")
+        self.url = url
+        self.rate_limiter = rate_limiter or TokenBucket.per_hour(API_KEY_REQUESTS_PER_HOUR)
+        self.max_batch_size = max_batch_size
+        self.max_retries = max_retries
+        self.requests_sent = 0
+        # OAuth 토큰은 api_key="Bearer <token>" 형식으로 전달
+        self._http = httpx.AsyncClient(
+            headers={"Authorization": api_key},
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            ),
+            timeout=timeout,
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> LinearClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def _post(self, query: str, variables: Mapping[str, Any]) -> dict[str, Any]:
+        """요청 1회 (rate limit 대기, 재시도 포함) - GraphQL errors가 있어도 data와 함께 반환"""
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire()
+            response = await self._http.post(
+                self.url, json={"query": query, "variables": dict(variables)}
+            )
+            self.requests_sent += 1
+
+            try:
+                payload = response.json()
+            except ValueError:
+                payload = {}
+            if not isinstance(payload, dict):
+                payload = {}
+            errors = payload.get("errors") or []
+
+            rate_limited = response.status_code == 429 or _is_rate_limited(errors)
+            remaining = response.headers.get("x-ratelimit-requests-remaining")
+            # rate limit 응답은 남은 요청 수(보통 0) 대신 재시도 대기 시간으로 rate limiter를 맞춤
+            if remaining is not None and not rate_limited:
+                self.rate_limiter.sync(float(remaining))
+
+            if rate_limited or (
+                response.status_code in _RETRY_STATUS and not _MUTATION_RE.match(query)
+            ):
+                if attempt < self.max_retries:
+                    delay = _retry_delay(response, attempt)
+                    if rate_limited:
+                        # 대기는 다음 acquire()에서 한 번만 - 같은 클라이언트의 다른 task도 함께 기다림
+                        self.rate_limiter.pause(delay)
+                    else:
+                        await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
+            if response.is_error and payload.get("data") is None:
+                if errors:
+                    raise _graphql_error(errors, response.status_code)
+                raise LinearAPIError(
+                    f"API request failed: {response.status_code} - {response.reason_phrase}",
+                    status_code=response.status_code,
+                )
+            return payload
+
+    async def execute(
+        self, query: str, variables: Mapping[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """GraphQL 문서 하나 실행 후 data 반환 (errors가 있으면 LinearAPIError)"""
+        payload = await self._post(query, variables or {})
+        errors = payload.get("errors") or []
+        if errors:
+            raise _graphql_error(errors)
+        return payload.get("data") or {}
+
+    async def batch(
+        self,
+        selections: Sequence[Selection],
+        *,
+        mutation: bool = False,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        여러 필드를 alias로 묶어 max_batch_size개씩 한 요청으로 실행
+
+        selections 순서대로 각 필드의 결과를 반환한다. 일부 필드만 실패하면 기본적으로
+        첫 오류를 raise하고, return_exceptions=True이면 해당 위치에 LinearAPIError를 넣는다.
+        청크가 여러 개면 동시에 요청한다 (뮤테이션 청크는 순서대로).
+        """
+        operation = "mutation" if mutation else "query"
+        chunks = [
+            selections[start : start + self.max_batch_size]
+            for start in range(0, len(selections), self.max_batch_size)
+        ]
+        if mutation:
+            chunk_results = [await self._batch_chunk(operation, chunk) for chunk in chunks]
+        else:
+            chunk_results = await asyncio.gather(
+                *(self._batch_chunk(operation, chunk) for chunk in chunks)
+            )
+        results = [result for chunk in chunk_results for result in chunk]
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, LinearAPIError):
+                    raise result
+        return results
+
+    async def _batch_chunk(self, operation: str, selections: Sequence[Selection]) -> list[Any]:
+        query, variables = build_batch(operation, selections)
+        payload = await self._post(query, variables)
+        data = payload.get("data") or {}
+        aliases = [f"b{index}" for index in range(len(selections))]
+        # path가 alias로 시작하는 오류는 해당 필드에만, 나머지는 모든 필드에 적용
+        by_alias: dict[str, list[Mapping[str, Any]]] = {alias: [] for alias in aliases}
+        unscoped = []
+        for error in payload.get("errors") or []:
+            path = error.get("path") or [None]
+            if path[0] in by_alias:
+                by_alias[path[0]].append(error)
+            else:
+                unscoped.append(error)
+
+        results: list[Any] = []
+        for alias in aliases:
+            errors = by_alias[alias] + unscoped
+            results.append(_graphql_error(errors) if errors else data.get(alias))
+        return results
+
+    async def paginate(
+        self,
+        query: str,
+        variables: Mapping[str, Any] | None = None,
+        *,
+        path: Sequence[str] | None = None,
+        page_size: int = 50,
+        limit: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        cursor 기반 페이지네이션 - connection의 node를 하나씩 반환
+
+        query는 $first: Int!, $after: String 변수를 받고 `nodes`와
+        `pageInfo { hasNextPage endCursor }`를 선택하는 connection을 포함해야 한다.
+        path는 data에서 connection까지의 키 목록 (기본값: 최상위 필드가 하나면 그 필드).
+        현재 페이지의 node를 넘기는 동안 다음 페이지를 미리 요청한다.
+        """
+        remaining = limit
+
+        def fetch(after: str | None) -> asyncio.Task[dict[str, Any]]:
+            first = min(page_size, MAX_PAGE_SIZE)
+            if remaining is not None:
+                first = min(first, remaining)
+            page_variables = {**(variables or {}), "first": first, "after": after}
+            return asyncio.ensure_future(self.execute(query, page_variables))
+
+        task: asyncio.Task[dict[str, Any]] | None = None if remaining == 0 else fetch(None)
+        try:
+            while task is not None:
+                data = await task
+                task = None
+                connection: Any = data
+                for key in path if path is not None else list(data)[:1]:
+                    connection = connection[key]
+                nodes = connection["nodes"]
+                if remaining is not None:
+                    nodes = nodes[:remaining]
+                    remaining -= len(nodes)
+                page_info = connection["pageInfo"]
+                if page_info["hasNextPage"] and nodes and remaining != 0:
+                    task = fetch(page_info["endCursor"])
+                for node in nodes:
+                    yield node
+        finally:
+            if task is not None:
+                task.cancel()
+                # 취소된 prefetch의 예외가 "never retrieved" 경고로 남지 않도록
+                task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+    def iter_issues(
+        self,
+        *,
+        filter: Mapping[str, Any] | None = None,
+        limit: int | None = None,
+        page_size: int = 50,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """issue를 페이지 단위로 가져오며 하나씩 반환 (filter는 Linear IssueFilter)"""
+        query = f"""
+        query Issues($first: Int!, $after: String, $filter: IssueFilter) {{
+          issues(first: $first, after: $after, filter: $filter) {{
+            nodes {{ {ISSUE_FIELDS} }}
+            pageInfo {{ hasNextPage endCursor }}
+          }}
+        }}
+        """
+        return self.paginate(
+            query, {"filter": dict(filter) if filter else None}, limit=limit, page_size=page_size
+        )
+
+    async def list_issues(
+        self, *, filter: Mapping[str, Any] | None = None, limit: int = 50
+    ) -> list[dict[str, Any]]:
+        return [
+            issue
+            async for issue in self.iter_issues(
+                filter=filter, limit=limit, page_size=min(limit, MAX_PAGE_SIZE)
+            )
+        ]
+
+    async def get_issues(self, ids: Sequence[str]) -> list[dict[str, Any]]:
+        """여러 issue를 id(또는 identifier)로 한 번에 조회"""
+        selections = [
+            Selection(f"issue(id: $id) {{ {ISSUE_FIELDS} }}", {"id": ("String!", issue_id)})
+            for issue_id in ids
+        ]
+        return await self.batch(selections)
+
+    async def create_document(
+        self, title: str, content: str, project_id: str | None = None
+    ) -> dict[str, Any]:
+        (document,) = await self.create_documents(
+            [{"title": title, "content": content, "project_id": project_id}]
+        )
+        return document
+
+    async def create_documents(
+        self, documents: Sequence[Mapping[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        여러 Document를 뮤테이션 batch로 생성
+
+        각 항목은 title, content, project_id(선택) 키를 가진다. 생성된 document 목록을 반환한다.
+        """
+        selections = []
+        for document in documents:
+            payload = {"title": document["title"], "content": document["content"]}
+            if document.get("project_id"):
+                payload["projectId"] = document["project_id"]
+            selections.append(
+                Selection(
+                    f"documentCreate(input: $input) {{ success document {{ {DOCUMENT_FIELDS} }} }}",
+                    {"input": ("DocumentCreateInput!", payload)},
+                )
+            )
+        results = await self.batch(selections, mutation=True)
+        return [result["document"] for result in results]
@@ -0,0 +1,334 @@
+"""
+비동기(큐 기반) 로깅 설정
+
+- 로그를 남기는 스레드는 QueueHandler로 큐에 넣기만 하고 파일/콘솔 I/O는 listener 스레드가 담당
+- listener는 큐에 쌓인 레코드를 한 번에 꺼내 handler별로 한 번의 write + flush로 기록 (batch)
+- 파일 로그는 JSON lines 형식 (한 줄에 레코드 하나) - 여러 프로세스의 파일을 시간순으로 병합 가능
+
+사용법 (애플리케이션):
+    from myproject.log import configure_logging
+
+    configure_logging(level="INFO", log_file="logs/app.jsonl")  # 프로세스 시작 시 한 번
+    logging.getLogger(__name__).info("started", extra={"request_id": request_id})
+
+테스트 세션 설정은 tests/conftest.py의 setup_logging 참고 (xdist 워커별 파일 → 세션 종료 시 병합).
+"""
+
+from __future__ import annotations
+
+import atexit
+import heapq
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler
+from pathlib import Path
+from typing import Any
+
+DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# listener가 한 번에 꺼내 기록하는 최대 레코드 수
+DEFAULT_BATCH_SIZE = 512
+
+# LogRecord 기본 속성 - 이 외의 속성(extra=...)은 JSON 필드로 기록
+_RECORD_ATTRIBUTES = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None)).keys()
+) | {"message", "asctime", "taskName"}
+
+# 기본 속성만 있는 레코드의 속성 수 - 이보다 많을 때만 extra 필드를 찾음
+_RECORD_ATTRIBUTE_COUNT = len(vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None)))
+
+_SENTINEL = None
+
+# 변경될 수 없는 값 - 큐에 넣을 때 복사하지 않음
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
+# configure_logging()이 logger별로 설치한 (listener, queue handler) - 같은 logger에 다시 호출하면 교체
+_active: dict[logging.Logger, tuple[BatchingQueueListener, logging.Handler]] = {}
+_active_lock = threading.Lock()
+
+
+def _extra_fields(record: logging.LogRecord) -> dict[str, Any]:
+    """extra=로 전달된 (LogRecord 기본 속성이 아닌) 필드"""
+    return {
+        key: value
+        for key, value in vars(record).items()
+        if key not in _RECORD_ATTRIBUTES and not key.startswith("_")
+    }
+
+
+def _freeze(value: Any) -> Any:
+    """로그 호출 시점의 값으로 고정 (JSON으로 기록될 형태의 복사본)"""
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    return json.loads(json.dumps(value, ensure_ascii=False, default=str))
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    레코드를 JSON 한 줄로 변환
+
+    기본 필드(ts, created, level, logger, message, process, thread)에
+    static_fields와 extra=로 전달한 값, 예외/스택 정보를 더한다.
+    """
+
+    def __init__(self, static_fields: Mapping[str, Any] | None = None):
+        super().__init__()
+        self.static_fields = dict(static_fields or {})
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "created": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "process": record.process,
+            "thread": record.threadName,
+            **self.static_fields,
+        }
+        entry.update(_extra_fields(record))
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        if record.stack_info:
+            entry["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _SnapshotQueueHandler(QueueHandler):
+    """
+    같은 프로세스 안의 큐로 보내는 QueueHandler
+
+    기본 prepare()는 호출 스레드에서 전체 포맷팅을 하므로, 복사본의 메시지와 extra 필드만
+    호출 시점 값으로 고정하고 나머지 포맷팅(JSON, 예외 traceback)은 listener 스레드로 미룬다.
+    extra의 dict/list 등은 호출 후 바뀔 수 있으므로 JSON으로 기록될 형태의 복사본으로 바꾼다.
+    원래 레코드는 바꾸지 않는다 (같은 logger의 다른 handler와 caplog는 원래 msg, args, extra를 봄).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # copy.copy(record)와 같은 얕은 복사 (copy 모듈을 거치지 않아 호출 스레드 비용이 적음)
+        snapshot = object.__new__(type(record))
+        fields = snapshot.__dict__ = record.__dict__.copy()
+        fields["msg"] = record.getMessage()
+        fields["args"] = None
+        if len(fields) > _RECORD_ATTRIBUTE_COUNT:
+            for key in fields.keys() - _RECORD_ATTRIBUTES:
+                value = fields[key]
+                if not key.startswith("_") and not isinstance(value, _IMMUTABLE_TYPES):
+                    fields[key] = _freeze(value)
+        return snapshot
+
+
+class BatchingQueueListener:
+    """
+    큐의 레코드를 batch로 handler에 전달하는 listener 스레드
+
+    logging.handlers.QueueListener와 같은 start()/stop() 인터페이스. 큐에 레코드가 쌓여 있으면
+    최대 batch_size개를 한 번에 꺼내고, StreamHandler(FileHandler 포함)에는 한 번의 write와 flush로 기록한다.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.SimpleQueue[Any],
+        *handlers: logging.Handler,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self.queue = log_queue
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._monitor, name="log-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """큐에 남은 레코드를 모두 기록한 뒤 스레드 종료"""
+        if self._thread is None:
+            return
+        self.queue.put(_SENTINEL)
+        self._thread.join()
+        self._thread = None
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """지금까지 큐에 들어간 레코드가 모두 기록될 때까지 대기 (timeout 내에 끝나면 True)"""
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self.queue.put(done)
+        return done.wait(timeout)
+
+    def _monitor(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            records = []
+            for item in batch:
+                if isinstance(item, logging.LogRecord):
+                    records.append(item)
+                    continue
+                # 종료/flush 표시 이전의 레코드를 먼저 기록
+                if records:
+                    self.handle_batch(records)
+                    records = []
+                if item is _SENTINEL:
+                    return
+                item.set()
+            if records:
+                self.handle_batch(records)
+
+    def handle_batch(self, records: list[logging.LogRecord]) -> None:
+        for handler in self.handlers:
+            accepted = [
+                record
+                for record in records
+                if record.levelno >= handler.level and handler.filter(record)
+            ]
+            if not accepted:
+                continue
+            if isinstance(handler, logging.StreamHandler):
+                _write_batch(handler, accepted)
+            else:
+                for record in accepted:
+                    handler.handle(record)
+
+
+def _write_batch(handler: logging.StreamHandler, records: list[logging.LogRecord]) -> None:
+    """레코드를 모두 포맷한 뒤 한 번에 write + flush (레코드마다 flush하는 StreamHandler.emit 대신)"""
+    lines = []
+    for record in records:
+        try:
+            lines.append(handler.format(record) + handler.terminator)
+        except Exception:
+            handler.handleError(record)
+    if not lines:
+        return
+    handler.acquire()
+    try:
+        handler.stream.write("".join(lines))
+        handler.stream.flush()
+    except Exception:
+        handler.handleError(records[0])
+    finally:
+        handler.release()
+
+
+def configure_logging(
+    level: int | str = "INFO",
+    *,
+    log_file: str | os.PathLike[str] | None = None,
+    console: bool = True,
+    console_format: str = DEFAULT_FORMAT,
+    static_fields: Mapping[str, Any] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    handlers: Iterable[logging.Handler] = (),
+    filters: Iterable[logging.Filter] = (),
+    logger: logging.Logger | None = None,
+) -> BatchingQueueListener:
+    """
+    logger(기본값: root logger)에 큐 기반 로깅 설치
+
+    log_file이 있으면 JSON lines로, console=True이면 stderr에 console_format으로 기록한다.
+    handlers는 추가로 연결할 handler (listener 스레드에서 실행), filters는 큐에 넣기 전
+    로그를 남기는 스레드에서 실행된다 (요청 ID 등 컨텍스트 추가용).
+    다시 호출하면 이전 설정을 종료(남은 로그 기록)하고 교체한다. 프로세스 종료 시 자동으로 정리된다.
+    """
+    target = logger or logging.getLogger()
+    sinks: list[logging.Handler] = list(handlers)
+    if log_file is not None:
+        path = Path(log_file)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.FileHandler(path, encoding="utf-8")
+        file_handler.setFormatter(JSONFormatter(static_fields))
+        sinks.append(file_handler)
+    if console:
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.setFormatter(logging.Formatter(console_format))
+        sinks.append(console_handler)
+
+    log_queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+    listener = BatchingQueueListener(log_queue, *sinks, batch_size=batch_size)
+    queue_handler = _SnapshotQueueHandler(log_queue)
+    for log_filter in filters:
+        queue_handler.addFilter(log_filter)
+
+    with _active_lock:
+        _shutdown_locked(target)
+        target.addHandler(queue_handler)
+        target.setLevel(level)
+        listener.start()
+        _active[target] = (listener, queue_handler)
+    return listener
+
+
+def _shutdown_locked(target: logging.Logger) -> None:
+    if target not in _active:
+        return
+    listener, queue_handler = _active.pop(target)
+    target.removeHandler(queue_handler)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def shutdown_logging(logger: logging.Logger | None = None) -> None:
+    """
+    configure_logging()으로 설치한 handler 제거, 남은 로그 기록 후 listener 종료
+
+    logger를 지정하지 않으면 설치된 모든 설정을 종료한다.
+    """
+    with _active_lock:
+        for target in [logger] if logger is not None else list(_active):
+            _shutdown_locked(target)
+
+
+atexit.register(shutdown_logging)
+
+
+def _read_entries(path: Path) -> Iterator[tuple[float, int, str]]:
+    with path.open(encoding="utf-8") as lines:
+        for number, line in enumerate(lines):
+            line = line.rstrip("\n")
+            if not line:
+                continue
+            try:
+                created = float(json.loads(line).get("created", 0.0))
+            except (ValueError, AttributeError):
+                created = 0.0
+            yield created, number, line
+
+
+def merge_log_files(
+    sources: Iterable[str | os.PathLike[str]],
+    destination: str | os.PathLike[str],
+    *,
+    remove_sources: bool = False,
+) -> int:
+    """
+    JSON lines 로그 파일들을 created 시간순으로 병합 (각 파일은 시간순이라고 가정)
+
+    병합한 줄 수를 반환한다. destination이 sources에 포함되면 안 된다.
+    """
+    paths = [Path(source) for source in sources]
+    output = Path(destination)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with output.open("w", encoding="utf-8") as merged:
+        for _created, _number, line in heapq.merge(*(_read_entries(path) for path in paths)):
+            merged.write(line + "\n")
+            count += 1
+    if remove_sources:
+        for path in paths:
+            path.unlink()
+    return count
@@ -0,0 +1,18 @@
+"""
+벤치마크 테스트 설정
+- 이 디렉토리의 모든 테스트에 benchmark 마커 적용 (기본 실행에서 제외)
+- 실행: pytest --benchmark tests/benchmarks/
+- 측정은 bench 픽스처 사용 (tests/plugins/benchmark.py)
+"""
+
+from pathlib import Path
+
+import pytest
+
+BENCHMARKS_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items):
+    for item in items:
+        if BENCHMARKS_DIR in item.path.parents:
+            item.add_marker(pytest.mark.benchmark)
@@ -0,0 +1,97 @@
+"""
+로깅 처리량 벤치마크
+- basicConfig: logging.basicConfig와 같은 구성 (StreamHandler/FileHandler, 레코드마다 write + flush)
+- queue: myproject.log.configure_logging (QueueHandler → listener 스레드가 batch로 기록)
+
+*_emit은 로그를 남기는 스레드가 기다리는 시간만, queue_flush는 파일에 모두 기록될 때까지를 측정합니다.
+*_slow_io는 write마다 지연이 있는 출력(여러 xdist 워커가 같은 디스크/터미널에 쓰는 상황)을 흉내 냅니다.
+로컬 파일(write가 빠른 경우)에서는 queue_emit이 basic_config_emit보다 느릴 수 있습니다 (README "로깅" 참고).
+"""
+
+import io
+import logging
+import time
+
+import pytest
+
+from myproject.log import DEFAULT_FORMAT, configure_logging, shutdown_logging
+
+RECORDS = 1000
+SLOW_IO_RECORDS = 200
+# write 1회당 지연 (초)
+SLOW_IO_LATENCY = 0.0002
+
+
+class SlowStream(io.StringIO):
+    """write마다 I/O 지연을 흉내 내는 스트림"""
+
+    def write(self, text):
+        time.sleep(SLOW_IO_LATENCY)
+        return super().write(text)
+
+
+@pytest.fixture
+def bench_logger():
+    logger = logging.getLogger("benchmarks.logging")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    yield logger
+    shutdown_logging(logger)
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
+    logger.propagate = True
+
+
+def _emit(logger, records=RECORDS):
+    for index in range(records):
+        logger.info("processed item %d of %d", index, records, extra={"job": "bench"})
+
+
+def _basic_handler(handler):
+    handler.setFormatter(logging.Formatter(DEFAULT_FORMAT))
+    return handler
+
+
+def test_logging_basic_config_emit(bench, tmp_path, bench_logger):
+    bench_logger.addHandler(_basic_handler(logging.FileHandler(tmp_path / "basic.log")))
+
+    bench(_emit, bench_logger)
+
+
+def test_logging_queue_emit(bench, tmp_path, bench_logger):
+    listener = configure_logging(
+        log_file=tmp_path / "queue.jsonl", console=False, logger=bench_logger
+    )
+
+    bench(_emit, bench_logger)
+    listener.flush()
+
+
+def test_logging_queue_flush(bench, tmp_path, bench_logger):
+    listener = configure_logging(
+        log_file=tmp_path / "queue.jsonl", console=False, logger=bench_logger
+    )
+
+    def emit_and_flush():
+        _emit(bench_logger)
+        listener.flush()
+
+    bench(emit_and_flush)
+
+
+def test_logging_basic_config_slow_io(bench, bench_logger):
+    bench_logger.addHandler(_basic_handler(logging.StreamHandler(SlowStream())))
+
+    bench(_emit, bench_logger, SLOW_IO_RECORDS)
+
+
+def test_logging_queue_slow_io(bench, bench_logger):
+    listener = configure_logging(
+        console=False,
+        handlers=[_basic_handler(logging.StreamHandler(SlowStream()))],
+        logger=bench_logger,
+    )
+
+    bench(_emit, bench_logger, SLOW_IO_RECORDS)
+    listener.flush()
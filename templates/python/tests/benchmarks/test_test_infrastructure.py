@@ -0,0 +1,76 @@
+"""
+테스트 인프라 벤치마크
+- VCR cassette 로딩: YAML 파일 vs 인덱스 저장소 (tests/plugins/cassette_store.py)
+- 테스트별 DB setup: create/drop vs SAVEPOINT 롤백 (tests/plugins/database.py)
+"""
+
+import sqlite3
+
+import pytest
+from plugins.cassette_store import (
+    IndexedCassettePersister,
+    IndexedCassetteStore,
+    _write_synthetic_cassettes,
+    migrate_yaml_cassettes,
+)
+from plugins.database import EXAMPLE_SCHEMA, build_template, clone_to_memory, savepoint
+from vcr.persisters.filesystem import FilesystemPersister
+from vcr.serializers import yamlserializer
+
+CASSETTE_COUNT = 50
+
+
+@pytest.fixture(scope="module")
+def cassette_library(tmp_path_factory):
+    library_dir = tmp_path_factory.mktemp("cassettes")
+    _write_synthetic_cassettes(library_dir, CASSETTE_COUNT)
+    store = IndexedCassetteStore(library_dir / "cassettes.sqlite3")
+    migrate_yaml_cassettes(library_dir, IndexedCassettePersister(store, library_dir))
+    store.compact()
+    store.close()
+    return library_dir
+
+
+def test_cassette_replay_yaml(bench, cassette_library):
+    paths = sorted(cassette_library.glob("*.yaml"))
+
+    def load_all():
+        for path in paths:
+            FilesystemPersister.load_cassette(path, yamlserializer)
+
+    bench(load_all)
+
+
+def test_cassette_replay_indexed(bench, cassette_library):
+    paths = sorted(cassette_library.glob("*.yaml"))
+
+    def load_all():
+        with IndexedCassetteStore(cassette_library / "cassettes.sqlite3") as store:
+            persister = IndexedCassettePersister(store, cassette_library)
+            for path in paths:
+                persister.load_cassette(path, yamlserializer)
+
+    bench(load_all)
+
+
+def test_database_setup_create_drop(bench, tmp_path):
+    db_path = tmp_path / "naive.db"
+
+    def create_drop():
+        connection = sqlite3.connect(db_path)
+        connection.executescript(EXAMPLE_SCHEMA)
+        connection.close()
+        db_path.unlink()
+
+    bench(create_drop)
+
+
+def test_database_setup_savepoint(bench, tmp_path):
+    connection = clone_to_memory(build_template(tmp_path / "template.db", EXAMPLE_SCHEMA))
+
+    def rollback():
+        with savepoint(connection):
+            connection.execute("INSERT INTO users (name, email) VALUES ('b', 'b@example.com')")
+
+    bench(rollback)
+    connection.close()
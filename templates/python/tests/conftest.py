@@ -1,15 +1,37 @@
 """
 전역 테스트 설정
 - .env 파일에서 환경 변수 로드 (python-dotenv)
-- VCR 설정 (API 녹음/재생)
-- 기본 로깅 설정
+- VCR 설정 (API 녹음/재생, 인덱스 cassette 저장소)
+- 큐 기반 로깅 설정 (myproject.log, xdist 워커별 JSON lines → 세션 종료 시 병합)
+- 테스트/픽스처 실행 시간 기록 및 slow 마커 자동 적용 (plugins/timing.py)
+- 실행 시간 기반 xdist 스케줄링 (plugins/scheduling.py, --duration-schedule)
+- 커버리지 기반 변경 영향 테스트 선택 (plugins/impact.py, --impact)
+- 벤치마크 측정/baseline 비교 (plugins/benchmark.py, --benchmark)
+- 테스트/픽스처 메모리 측정 및 leak 검사 (plugins/memory.py, --memory)
 - 공통 유틸리티 픽스처
 """
-import os
 import logging
-import pytest
+import os
 from pathlib import Path
+
+import pytest
 from dotenv import load_dotenv
+from plugins.cassette_store import (
+    STORE_FILENAME,
+    IndexedCassettePersister,
+    IndexedCassetteStore,
+)
+
+from myproject.log import configure_logging, merge_log_files, shutdown_logging
+
+pytest_plugins = [
+    "pytester",
+    "plugins.timing",
+    "plugins.scheduling",
+    "plugins.impact",
+    "plugins.benchmark",
+    "plugins.memory",
+]
 
 # .env 파일 로드 (프로젝트 루트에서)
 # Priority: .env.local > .env
@@ -26,16 +48,64 @@ os.environ.setdefault("TEST_MODE", "true")
 
 
 # 로깅 설정
+# 워커별 로그 파일: logs/pytest/pytest-<worker>.jsonl → 세션 종료 시 logs/pytest/pytest.jsonl로 병합
+TEST_LOG_DIR = Path(os.getenv("TEST_LOG_DIR", Path(__file__).parent.parent / "logs" / "pytest"))
+_current_test = {"nodeid": None}
+
+
+def _worker_log_files():
+    return sorted(TEST_LOG_DIR.glob("pytest-*.jsonl"))
+
+
+class _CurrentTestFilter(logging.Filter):
+    """로그에 현재 실행 중인 테스트 nodeid 추가"""
+
+    def filter(self, record):
+        record.test = _current_test["nodeid"]
+        return True
+
+
+def pytest_runtest_logstart(nodeid, location):
+    _current_test["nodeid"] = nodeid
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session):
+    """이전 실행의 워커별 로그 파일 정리 (controller에서 xdist 워커 시작 전에)"""
+    if hasattr(session.config, "workerinput"):
+        return
+    for path in _worker_log_files():
+        path.unlink()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_logging():
-    """테스트 실행 시 로깅 설정"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    """
+    테스트 실행 시 로깅 설정
+
+    로그는 큐에 넣기만 하고 파일 기록은 listener 스레드가 batch로 처리 (테스트 스레드가 I/O로 블록되지 않음).
+    콘솔에는 출력하지 않음 - 실패한 테스트의 로그는 pytest의 "Captured log"로 확인.
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    configure_logging(
+        level=os.getenv("LOG_LEVEL", "INFO"),
+        log_file=TEST_LOG_DIR / f"pytest-{worker}.jsonl",
+        console=False,
+        static_fields={"worker": worker},
+        filters=[_CurrentTestFilter()],
     )
     yield
-    # 테스트 종료 후 정리
-    logging.shutdown()
+    # 남은 로그를 모두 기록한 뒤 종료
+    shutdown_logging()
+
+
+def pytest_sessionfinish(session):
+    """워커별 로그 파일을 시간순으로 병합 (xdist controller는 모든 워커 종료 후 호출됨)"""
+    if hasattr(session.config, "workerinput"):
+        return
+    sources = _worker_log_files()
+    if sources:
+        merge_log_files(sources, TEST_LOG_DIR / "pytest.jsonl", remove_sources=True)
 
 
 # 공통 픽스처 예시
@@ -64,9 +134,11 @@ def vcr_config():
     """
     VCR 설정: 실제 API 호출을 녹음하고 재생
 
-    첫 실행: 실제 API 호출 → cassette(.yaml)에 저장
+    첫 실행: 실제 API 호출 → cassette 파일(<cassette>.jsonl, 커밋 대상)과 로컬 인덱스에 저장
     이후 실행: cassette에서 재생 (API 호출 없음)
 
+    VCR_CASSETTE_STORE=yaml 이면 기존 방식(cassette별 .yaml 파일)을 사용
+
     주의: 녹음 시 API 키가 cassette에 포함되지 않도록 필터링됨
     """
     return {
@@ -85,6 +157,23 @@ def vcr_config():
     }
 
 
+@pytest.fixture(scope="module")
+def vcr(vcr, vcr_config):
+    """
+    pytest-vcr의 VCR 인스턴스에 인덱스 cassette 저장소를 등록
+
+    기존 YAML cassette 이전: python tests/plugins/cassette_store.py migrate
+    """
+    if os.getenv("VCR_CASSETTE_STORE", "indexed").lower() == "yaml":
+        yield vcr
+        return
+    library_dir = Path(vcr_config["cassette_library_dir"])
+    store = IndexedCassetteStore(library_dir / STORE_FILENAME)
+    vcr.register_persister(IndexedCassettePersister(store, library_dir))
+    yield vcr
+    store.close()
+
+
 def _filter_request(request):
     """
     요청에서 민감한 정보 필터링
@@ -3,35 +3,51 @@
 - 실제 서비스 연결 설정
 - 외부 API 테스트 환경 구성
 - 테스트 데이터베이스 설정
+  - 스키마/시드 데이터는 세션당 한 번 템플릿 파일로 생성
+  - xdist 워커마다 템플릿을 메모리 DB로 복제 (SQLite backup API)
+  - 각 테스트는 SAVEPOINT 안에서 실행 후 롤백 (테스트별 데이터 삭제 없음)
 """
+
 import pytest
+from plugins.database import EXAMPLE_SCHEMA, build_template, clone_to_memory, savepoint
 
 
 @pytest.fixture(scope="session")
-def test_database_url():
-    """테스트용 데이터베이스 URL"""
-    # 환경 변수나 설정 파일에서 가져오기
-    return "sqlite:///test.db"
+def database_schema():
+    """스키마 + 시드 데이터 SQL 스크립트 (실제 프로젝트 스키마로 교체)"""
+    return EXAMPLE_SCHEMA
+
+
+@pytest.fixture(scope="session")
+def test_database_url(tmp_path_factory, database_schema):
+    """테스트용 템플릿 데이터베이스 URL"""
+    # xdist 워커들의 basetemp(popen-gwN)는 같은 상위 디렉토리를 공유하므로
+    # 템플릿은 워커 수와 관계없이 한 번만 생성됨
+    base_dir = tmp_path_factory.getbasetemp()
+    if base_dir.name.startswith("popen-gw"):
+        base_dir = base_dir.parent
+    template_path = build_template(base_dir / "template.db", database_schema)
+    return f"sqlite:///{template_path}"
 
 
 @pytest.fixture(scope="session")
 def database_connection(test_database_url):
-    """실제 데이터베이스 연결 (세션 범위)"""
-    # 실제 데이터베이스 연결 생성
-    # connection = create_engine(test_database_url)
-    # yield connection
-    # connection.dispose()
-    yield None  # 실제 구현 시 교체
+    """템플릿을 복제한 워커 전용 메모리 데이터베이스 연결 (세션 범위)"""
+    connection = clone_to_memory(test_database_url.removeprefix("sqlite:///"))
+    yield connection
+    connection.close()
 
 
 @pytest.fixture
 def database_session(database_connection):
-    """각 테스트마다 새로운 데이터베이스 세션"""
-    # session = Session(database_connection)
-    # yield session
-    # session.rollback()  # 테스트 후 롤백
-    # session.close()
-    yield None  # 실제 구현 시 교체
+    """
+    각 테스트마다 SAVEPOINT로 격리된 데이터베이스 세션
+
+    테스트 종료 시 SAVEPOINT까지 롤백되므로 정리 작업이 필요 없음.
+    테스트 대상 코드가 직접 COMMIT하면 격리가 깨지므로 트랜잭션 관리는 호출 측에 맡길 것.
+    """
+    with savepoint(database_connection) as connection:
+        yield connection
 
 
 @pytest.fixture
@@ -41,11 +57,3 @@ def api_test_client():
     # client = TestClient(app)
     # yield client
     yield None  # 실제 구현 시 교체
-
-
-@pytest.fixture(autouse=True)
-def cleanup_test_data(database_session):
-    """각 테스트 후 생성된 테스트 데이터 정리"""
-    yield
-    # 테스트 데이터 정리 로직
-    pass
@@ -0,0 +1,59 @@
+"""
+database_session 픽스처 통합 테스트
+
+템플릿 복제 DB에서 테스트별 쓰기가 다음 테스트 전에 롤백되는지 검사합니다.
+xdist 사용 시 테스트가 어느 워커에 배정되든 워커별 연결 상태를 모듈 종료 시 다시 확인합니다.
+"""
+
+import sqlite3
+
+import pytest
+
+pytestmark = [pytest.mark.integration, pytest.mark.database]
+
+# EXAMPLE_SCHEMA 시드 데이터
+SEED_USERS = 1000
+SEED_ORDERS = 5000
+
+
+def _count(connection, table):
+    return connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def database_restored(database_connection):
+    """이 워커에서 실행된 모듈의 테스트가 모두 끝난 뒤 시드 상태로 돌아왔는지 확인"""
+    yield
+    assert not database_connection.in_transaction
+    assert _count(database_connection, "users") == SEED_USERS
+    assert _count(database_connection, "orders") == SEED_ORDERS
+
+
+def test_seed_data_is_cloned_from_template(database_session):
+    assert _count(database_session, "users") == SEED_USERS
+    assert _count(database_session, "orders") == SEED_ORDERS
+
+
+@pytest.mark.parametrize("attempt", range(3))
+def test_write_is_rolled_back_before_next_test(database_session, attempt):
+    assert _count(database_session, "users") == SEED_USERS
+
+    # email은 UNIQUE - 이전 테스트의 쓰기가 남아 있으면 IntegrityError
+    database_session.execute(
+        "INSERT INTO users (name, email) VALUES (?, ?)",
+        (f"attempt {attempt}", "isolated@example.com"),
+    )
+    database_session.execute("DELETE FROM orders WHERE user_id = 1")
+
+    assert _count(database_session, "users") == SEED_USERS + 1
+    assert _count(database_session, "orders") < SEED_ORDERS
+
+
+def test_failed_statement_keeps_session_usable(database_session):
+    with pytest.raises(sqlite3.IntegrityError):
+        database_session.execute("INSERT INTO orders (user_id, amount) VALUES (?, ?)", (-1, 10))
+
+    database_session.execute("UPDATE users SET name = 'changed' WHERE id = 1")
+    assert database_session.execute("SELECT name FROM users WHERE id = 1").fetchone() == (
+        "changed",
+    )
@@ -0,0 +1,74 @@
+"""
+myproject.linear 통합 테스트 - 로컬 stub 서버
+
+실제 HTTP 연결로 연결 풀 재사용과 동시 요청 처리를 검사합니다.
+실제 Linear API 응답은 @pytest.mark.vcr로 녹음/재생하세요 (vcrpy가 httpx를 지원).
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from myproject.linear import LinearClient
+
+pytestmark = pytest.mark.integration
+
+
+class _StubServer(ThreadingHTTPServer):
+    """받은 요청과 클라이언트 연결(주소)을 기록하는 서버"""
+
+    def __init__(self, handler):
+        super().__init__(("127.0.0.1", 0), handler)
+        self.connections: set[tuple[str, int]] = set()
+        self.requests: list[dict] = []
+
+
+class _GraphQLHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    server: _StubServer
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.connections.add(self.client_address)
+        self.server.requests.append(body)
+        payload = json.dumps({"data": {"viewer": {"id": "user-1"}}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("X-RateLimit-Requests-Remaining", "1400")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def linear_stub_server():
+    """Linear GraphQL endpoint를 흉내 내는 로컬 HTTP 서버 (URL 반환)"""
+    server = _StubServer(_GraphQLHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_connection_pool(linear_stub_server):
+    url = f"http://127.0.0.1:{linear_stub_server.server_port}/graphql"
+
+    async with LinearClient("lin_api_test", url=url, max_connections=4) as client:
+        results = await asyncio.gather(
+            *(client.execute("query { viewer { id } }") for _ in range(40))
+        )
+
+    assert all(result == {"viewer": {"id": "user-1"}} for result in results)
+    assert len(linear_stub_server.requests) == 40
+    assert len(linear_stub_server.connections) <= 4
+    # 응답 헤더의 남은 요청 수로 rate limiter가 동기화됨
+    assert client.rate_limiter.available < 1401
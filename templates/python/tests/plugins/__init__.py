@@ -0,0 +1,5 @@
+"""
+테스트 인프라 플러그인
+- tests/conftest.py의 pytest_plugins로 등록되어 사용됨
+- 각 모듈은 독립적으로 import 가능하며, 일부는 CLI(python tests/plugins/<module>.py)를 제공
+"""
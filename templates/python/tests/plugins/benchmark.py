@@ -0,0 +1,373 @@
+"""
+벤치마크 플러그인 (tests/benchmarks/)
+
+- `benchmark` 마커가 붙은 테스트는 기본 실행에서 제외 (`--benchmark`로 실행)
+- `bench` 픽스처: warmup, 반복 측정(rounds), 라운드당 호출 횟수 자동 보정, 통계 계산
+- 결과를 머신/커밋별 JSON baseline으로 저장 (.benchmarks/<machine>/<commit>.json, 로컬 전용)
+- 커밋된 기준 baseline(tests/benchmarks/baselines/<machine>.json)은 로컬 baseline이 없을 때
+  (CI, 새 머신) 비교 대상으로 사용
+- 이전 baseline 대비 중앙값이 설정한 비율 이상 느려지면 테스트 실패
+
+baseline 선택 순서 (--benchmark-compare가 없을 때):
+    1. 현재 커밋을 제외한 가장 최근 로컬 baseline
+    2. 현재 커밋의 로컬 baseline (같은 커밋에서 다시 실행한 경우)
+    3. 커밋된 기준 baseline
+
+machine 키는 OS, 아키텍처, Python 버전으로 만든다 (호스트 이름 제외 - CI 러너마다 달라짐).
+같은 키를 쓰는 머신의 성능이 다르면 --benchmark-machine/benchmark_machine으로 구분할 것.
+
+사용법:
+    pytest --benchmark tests/benchmarks/                         # 실행 + baseline과 비교
+    pytest --benchmark --benchmark-save tests/benchmarks/        # 현재 커밋 baseline 저장
+    pytest --benchmark --benchmark-save-reference                # 기준 baseline 갱신 (커밋 대상)
+    pytest --benchmark --benchmark-compare=abc1234               # 특정 커밋(또는 JSON 파일)과 비교
+    pytest --benchmark --benchmark-max-regression=5              # 허용 성능 저하 5%
+
+pytest-benchmark 플러그인과 충돌하지 않도록 픽스처 이름은 `bench`를 사용한다.
+측정 노이즈를 줄이려면 xdist(-n) 없이 실행할 것.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import re
+import statistics
+import subprocess
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+RESULT_VERSION = 1
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark", "벤치마크")
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="benchmark 마커가 붙은 테스트 실행 (기본값: 제외)",
+    )
+    group.addoption(
+        "--benchmark-save",
+        action="store_true",
+        default=False,
+        help="결과를 현재 머신/커밋의 baseline으로 저장",
+    )
+    group.addoption(
+        "--benchmark-save-reference",
+        action="store_true",
+        default=False,
+        help="결과를 커밋용 기준 baseline(benchmark_reference_dir/<machine>.json)으로 저장",
+    )
+    group.addoption(
+        "--benchmark-compare",
+        action="store",
+        default=None,
+        metavar="COMMIT",
+        help="비교할 baseline 커밋 또는 JSON 파일 경로 (기본값: 가장 최근 baseline)",
+    )
+    group.addoption(
+        "--benchmark-machine",
+        action="store",
+        default=None,
+        metavar="NAME",
+        help="baseline machine 키 (기본값: ini benchmark_machine, 비어 있으면 자동)",
+    )
+    group.addoption(
+        "--benchmark-max-regression",
+        action="store",
+        type=float,
+        default=None,
+        metavar="PERCENT",
+        help="허용하는 중앙값 증가율 (기본값: ini benchmark_max_regression)",
+    )
+    parser.addini(
+        "benchmark_storage", "로컬 baseline 저장 디렉토리 (rootdir 기준)", default=".benchmarks"
+    )
+    parser.addini(
+        "benchmark_reference_dir",
+        "커밋된 기준 baseline 디렉토리 (rootdir 기준)",
+        default="tests/benchmarks/baselines",
+    )
+    parser.addini("benchmark_machine", "baseline machine 키 (비어 있으면 자동)", default="")
+    parser.addini("benchmark_max_regression", "허용하는 중앙값 증가율 (%)", default="10")
+    parser.addini("benchmark_warmup", "측정 전 warmup 라운드 수", default="1")
+    parser.addini("benchmark_rounds", "측정 라운드 수", default="7")
+    parser.addini("benchmark_min_time", "라운드당 최소 측정 시간 (초)", default="0.02")
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(BenchmarkSession(config), "benchmark_session")
+
+
+def machine_id(name: str | None = None) -> str:
+    """baseline 키로 사용할 머신 식별자 (지정하지 않으면 OS, 아키텍처, Python 버전)"""
+    if not name:
+        major, minor, _ = platform.python_version_tuple()
+        name = "-".join(
+            [
+                platform.system(),
+                platform.machine(),
+                f"{platform.python_implementation()}{major}.{minor}",
+            ]
+        )
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).lower()
+
+
+def current_commit(cwd: Path) -> str:
+    """짧은 커밋 해시 (커밋되지 않은 변경이 있으면 -dirty, git이 없으면 unknown)"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def summarize(samples: list[float], number: int) -> dict[str, Any]:
+    """라운드별 측정값(초/호출) 통계"""
+    ordered = sorted(samples)
+    quartiles = statistics.quantiles(ordered, n=4) if len(ordered) >= 2 else [ordered[0]] * 3
+    return {
+        "rounds": len(samples),
+        "number": number,
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": statistics.fmean(ordered),
+        "median": statistics.median(ordered),
+        "stdev": statistics.stdev(ordered) if len(ordered) >= 2 else 0.0,
+        "iqr": quartiles[2] - quartiles[0],
+    }
+
+
+def _format_seconds(value: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if value >= scale:
+            return f"{value / scale:8.3f} {unit}"
+    return f"{value / 1e-9:8.1f} ns"
+
+
+class Bench:
+    """
+    벤치마크 측정기 (`bench` 픽스처)
+
+    bench(func, *args, **kwargs)로 호출하면 warmup 후 rounds번 측정하고 func의 결과를 반환한다.
+    라운드당 호출 횟수는 min_time을 넘도록 자동으로 늘린다 (timeit.autorange와 같은 방식).
+    """
+
+    def __init__(self, session: BenchmarkSession, nodeid: str):
+        self.session = session
+        self.nodeid = nodeid
+        self.results: dict[str, dict[str, Any]] = {}
+
+    def _calibrate(self, call: Callable[[], Any]) -> int:
+        number = 1
+        while True:
+            started = time.perf_counter()
+            for _ in range(number):
+                call()
+            if time.perf_counter() - started >= self.session.min_time:
+                return number
+            number *= 2
+
+    def __call__(
+        self, func: Callable[..., Any], *args: Any, name: str | None = None, **kwargs: Any
+    ) -> Any:
+        key = self.nodeid if name is None else f"{self.nodeid}[{name}]"
+        if key in self.results:
+            raise ValueError(f"benchmark {key!r} measured twice; pass name= to distinguish")
+
+        def call() -> Any:
+            return func(*args, **kwargs)
+
+        result = call()
+        number = self._calibrate(call)
+        for _ in range(self.session.warmup):
+            for _ in range(number):
+                call()
+
+        samples = []
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(self.session.rounds):
+                started = time.perf_counter()
+                for _ in range(number):
+                    call()
+                samples.append((time.perf_counter() - started) / number)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        stats = summarize(samples, number)
+        self.results[key] = stats
+        self.session.check_regression(key, stats)
+        return result
+
+
+class BenchmarkSession:
+    """benchmark 테스트 선택, 결과 수집, baseline 저장/비교"""
+
+    def __init__(self, config: pytest.Config):
+        self.config = config
+        self.enabled = config.getoption("--benchmark")
+        self.is_worker = hasattr(config, "workerinput")
+        self.warmup = int(config.getini("benchmark_warmup"))
+        self.rounds = int(config.getini("benchmark_rounds"))
+        self.min_time = float(config.getini("benchmark_min_time"))
+        max_regression = config.getoption("--benchmark-max-regression")
+        if max_regression is None:
+            max_regression = float(config.getini("benchmark_max_regression"))
+        self.max_regression = max_regression
+
+        rootdir = Path(config.rootpath)
+        self.machine = machine_id(
+            config.getoption("--benchmark-machine") or config.getini("benchmark_machine")
+        )
+        storage = Path(config.getini("benchmark_storage"))
+        self.storage = (storage if storage.is_absolute() else rootdir / storage) / self.machine
+        reference_dir = Path(config.getini("benchmark_reference_dir"))
+        if not reference_dir.is_absolute():
+            reference_dir = rootdir / reference_dir
+        self.reference_path = reference_dir / f"{self.machine}.json"
+        # git 호출은 벤치마크 실행 시에만
+        self.commit = current_commit(rootdir) if self.enabled else "unknown"
+        self.baseline_commit, self.baseline = self._load_baseline(
+            config.getoption("--benchmark-compare")
+        )
+        self.results: dict[str, dict[str, Any]] = {}
+        self.saved_paths: list[Path] = []
+
+    def _load_baseline(self, commit: str | None) -> tuple[str | None, dict[str, Any]]:
+        if not self.enabled:
+            return None, {}
+        if commit is not None:
+            path = Path(commit)
+            candidates = [path if path.suffix == ".json" else self.storage / f"{commit}.json"]
+        else:
+            own = self.storage / f"{self.commit}.json"
+            candidates = sorted(
+                (path for path in self.storage.glob("*.json") if path != own),
+                key=lambda path: path.stat().st_mtime,
+                reverse=True,
+            )
+            candidates += [own, self.reference_path]
+        for path in candidates:
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if data.get("version") == RESULT_VERSION:
+                label = data.get("commit", path.stem)
+                if path == self.reference_path:
+                    label = f"reference {label}"
+                return label, data.get("benchmarks", {})
+        if commit is not None:
+            raise pytest.UsageError(f"benchmark baseline not found: {candidates[0]}")
+        return None, {}
+
+    def check_regression(self, key: str, stats: dict[str, Any]) -> None:
+        baseline = self.baseline.get(key)
+        if not baseline or not baseline.get("median"):
+            return
+        change = (stats["median"] - baseline["median"]) / baseline["median"] * 100
+        stats["baseline_median"] = baseline["median"]
+        stats["change_percent"] = change
+        if change > self.max_regression:
+            pytest.fail(
+                f"benchmark regression: median {_format_seconds(stats['median']).strip()} vs "
+                f"{_format_seconds(baseline['median']).strip()} at {self.baseline_commit} "
+                f"({change:+.1f}% > {self.max_regression:g}%)",
+                pytrace=False,
+            )
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        """--benchmark 없이 실행하면 benchmark 테스트 제외 (-m 으로 직접 고른 경우는 그대로 둠)"""
+        if self.enabled or "benchmark" in (config.option.markexpr or ""):
+            return
+        selected: list[pytest.Item] = []
+        deselected: list[pytest.Item] = []
+        for item in items:
+            (deselected if item.get_closest_marker("benchmark") else selected).append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+
+    @pytest.fixture
+    def bench(self, request):
+        """벤치마크 측정 픽스처 - bench(func, *args, **kwargs)"""
+        measurer = Bench(self, request.node.nodeid)
+        yield measurer
+        # xdist 사용 시에도 controller가 결과를 모을 수 있도록 report에 실어 보냄
+        for key, stats in measurer.results.items():
+            request.node.user_properties.append(("benchmark", {"key": key, "stats": stats}))
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        for name, value in report.user_properties:
+            if name == "benchmark":
+                self.results[value["key"]] = value["stats"]
+
+    def pytest_sessionfinish(self, session):
+        if self.is_worker or not self.results:
+            return
+        paths = []
+        if self.config.getoption("--benchmark-save"):
+            paths.append(self.storage / f"{self.commit}.json")
+        if self.config.getoption("--benchmark-save-reference"):
+            paths.append(self.reference_path)
+        payload = {
+            "version": RESULT_VERSION,
+            "machine": {
+                "id": self.machine,
+                "node": platform.node(),
+                "system": platform.platform(),
+                "processor": platform.processor(),
+                "python": platform.python_version(),
+            },
+            "commit": self.commit,
+            "created_at": time.time(),
+            "benchmarks": self.results,
+        }
+        for path in paths:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(payload, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+            self.saved_paths.append(path)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.is_worker or not self.results:
+            return
+        write = terminalreporter.write_line
+        terminalreporter.section("benchmarks")
+        baseline = f" (baseline: {self.baseline_commit})" if self.baseline_commit else ""
+        write(f"machine: {self.machine}  commit: {self.commit}{baseline}")
+        write(f"{'median':>11} {'stdev':>11} {'rounds':>7} {'change':>8}  name")
+        for key, stats in sorted(self.results.items()):
+            change = stats.get("change_percent")
+            change_text = f"{change:+7.1f}%" if change is not None else f"{'-':>8}"
+            write(
+                f"{_format_seconds(stats['median'])} {_format_seconds(stats['stdev'])} "
+                f"{stats['rounds']:>7} {change_text}  {key}"
+            )
+        for path in self.saved_paths:
+            write(f"baseline saved: {path}")
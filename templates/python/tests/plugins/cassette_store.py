@@ -0,0 +1,489 @@
+"""
+인덱스 기반 cassette 저장소 (VCR persister)
+
+- 커밋 대상은 cassette별 JSON lines 파일 (tests/cassettes/<cassette>.jsonl, 한 줄에 interaction 하나)
+  - 텍스트이므로 리뷰에서 diff를 볼 수 있고 pre-commit 훅(detect-private-key 등)이 검사 가능
+- 재생 시에는 로컬 SQLite 인덱스(tests/cassettes/cassettes.sqlite3, gitignore)에서 읽음
+  - request/response는 zlib 압축된 JSON으로 저장
+  - (cassette, position) 기본키와 request hash 인덱스로 필요한 cassette만 조회
+  - 읽기 연결은 mmap(PRAGMA mmap_size)으로 페이지를 매핑하여 전체 파일을 읽지 않음
+  - .jsonl 파일이 바뀌면(mtime/크기) 해당 cassette만 인덱스에 다시 반영
+
+VCR이 녹음 전에 before_record_request/before_record_response 훅을 적용하므로
+저장소에는 필터링된 interaction만 기록된다. 기존 YAML cassette를 옮길 때는
+migrate 명령이 같은 훅(tests/conftest.py의 _filter_request/_filter_response)을 다시 적용한다.
+
+사용법:
+    python tests/plugins/cassette_store.py migrate [--remove-yaml]
+    python tests/plugins/cassette_store.py compact
+    python tests/plugins/cassette_store.py bench [--rounds 5] [--synthetic 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import zlib
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+from vcr.persisters.filesystem import CassetteNotFoundError, FilesystemPersister
+from vcr.request import Request
+from vcr.serializers import compat, yamlserializer
+
+STORE_FILENAME = "cassettes.sqlite3"
+EXPORT_SUFFIX = ".jsonl"
+DEFAULT_LIBRARY_DIR = Path(__file__).resolve().parent.parent / "cassettes"
+
+# 읽기 시 mmap으로 매핑할 최대 크기 (256MB)
+MMAP_SIZE = 256 * 1024 * 1024
+COMPRESSION_LEVEL = 6
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cassettes (
+    name TEXT PRIMARY KEY,
+    interaction_count INTEGER NOT NULL,
+    recorded_at REAL NOT NULL,
+    source TEXT NOT NULL DEFAULT ''
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS interactions (
+    cassette TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    request_hash TEXT NOT NULL,
+    request BLOB NOT NULL,
+    response BLOB NOT NULL,
+    PRIMARY KEY (cassette, position)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_interactions_hash ON interactions (cassette, request_hash);
+"""
+
+Interaction = tuple[dict[str, Any], dict[str, Any]]
+Hook = Callable[[Any], Any]
+
+
+def _json_default(value: Any) -> Any:
+    """JSON으로 표현할 수 없는 바이너리 body를 base64로 변환"""
+    if isinstance(value, bytes | bytearray):
+        return {"__b64__": base64.b64encode(bytes(value)).decode("ascii")}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_object_hook(obj: dict[str, Any]) -> Any:
+    if len(obj) == 1 and "__b64__" in obj:
+        return base64.b64decode(obj["__b64__"])
+    return obj
+
+
+def _encode(obj: Any) -> bytes:
+    data = json.dumps(obj, default=_json_default, separators=(",", ":"))
+    return zlib.compress(data.encode("utf-8"), COMPRESSION_LEVEL)
+
+
+def _decode(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob), object_hook=_json_object_hook)
+
+
+def _source_signature(path: Path) -> str:
+    """인덱스 갱신 여부 판단용 .jsonl 파일 서명 (mtime + 크기)"""
+    stat = path.stat()
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def read_jsonl_cassette(path: Path) -> list[Interaction]:
+    interactions = []
+    with path.open(encoding="utf-8") as lines:
+        for line in lines:
+            if line.strip():
+                entry = json.loads(line, object_hook=_json_object_hook)
+                interactions.append((entry["request"], entry["response"]))
+    return interactions
+
+
+def write_jsonl_cassette(path: Path, interactions: list[Interaction]) -> None:
+    """리뷰용 텍스트로 저장 (키 정렬, 한 줄에 interaction 하나, 임시 파일 후 교체)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    with temp_path.open("w", encoding="utf-8") as output:
+        for request, response in interactions:
+            entry = {"request": request, "response": response}
+            output.write(
+                json.dumps(entry, default=_json_default, ensure_ascii=False, sort_keys=True) + "\n"
+            )
+    os.replace(temp_path, path)
+
+
+def request_hash(request: dict[str, Any]) -> str:
+    """method + uri + body 기반 요청 해시 (헤더는 필터링 대상이므로 제외)"""
+    body = request.get("body")
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    digest = hashlib.sha256()
+    digest.update(str(request.get("method", "")).upper().encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(str(request.get("uri", "")).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(body or b"")
+    return digest.hexdigest()
+
+
+class IndexedCassetteStore:
+    """단일 SQLite 파일 기반 cassette 저장소"""
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._connection: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # xdist 워커가 동시에 녹음할 수 있으므로 잠금 대기 시간을 넉넉히 둔다
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self) -> IndexedCassetteStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def has(self, cassette: str) -> bool:
+        return self.source(cassette) is not None
+
+    def source(self, cassette: str) -> str | None:
+        """저장 시 기록한 원본 파일 서명 (없는 cassette이면 None)"""
+        row = (
+            self._connect()
+            .execute("SELECT source FROM cassettes WHERE name = ?", (cassette,))
+            .fetchone()
+        )
+        return row[0] if row else None
+
+    def names(self) -> list[str]:
+        rows = self._connect().execute("SELECT name FROM cassettes ORDER BY name")
+        return [name for (name,) in rows]
+
+    def load(self, cassette: str) -> list[Interaction]:
+        """cassette의 interaction을 녹음 순서대로 반환 (해당 cassette의 행만 읽음)"""
+        rows = self._connect().execute(
+            "SELECT request, response FROM interactions WHERE cassette = ? ORDER BY position",
+            (cassette,),
+        )
+        return [(_decode(request), _decode(response)) for request, response in rows]
+
+    def find(self, cassette: str, request: dict[str, Any]) -> dict[str, Any] | None:
+        """request hash 인덱스로 첫 번째로 일치하는 response를 조회"""
+        row = (
+            self._connect()
+            .execute(
+                "SELECT response FROM interactions WHERE cassette = ? AND request_hash = ? "
+                "ORDER BY position LIMIT 1",
+                (cassette, request_hash(request)),
+            )
+            .fetchone()
+        )
+        return _decode(row[0]) if row else None
+
+    def save(self, cassette: str, interactions: list[Interaction], source: str = "") -> None:
+        """cassette 전체를 교체 저장 (하나의 트랜잭션)"""
+        rows = [
+            (cassette, position, request_hash(request), _encode(request), _encode(response))
+            for position, (request, response) in enumerate(interactions)
+        ]
+        connection = self._connect()
+        with connection:
+            connection.execute("DELETE FROM interactions WHERE cassette = ?", (cassette,))
+            connection.executemany(
+                "INSERT INTO interactions (cassette, position, request_hash, request, response) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO cassettes (name, interaction_count, recorded_at, source) "
+                "VALUES (?, ?, ?, ?)",
+                (cassette, len(rows), time.time(), source),
+            )
+
+    def delete(self, cassette: str) -> None:
+        connection = self._connect()
+        with connection:
+            connection.execute("DELETE FROM interactions WHERE cassette = ?", (cassette,))
+            connection.execute("DELETE FROM cassettes WHERE name = ?", (cassette,))
+
+    def compact(self) -> None:
+        """WAL 내용을 본 파일에 반영하고 빈 페이지를 정리"""
+        connection = self._connect()
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        connection.execute("VACUUM")
+
+
+class IndexedCassettePersister:
+    """
+    VCR persister 구현 (vcr.register_persister에 인스턴스로 등록)
+
+    cassette 경로는 library_dir 기준 상대 경로(.yaml 확장자 제외)를 키로 사용한다.
+    녹음한 cassette는 <키>.jsonl 파일과 인덱스에 함께 저장하고, 재생 시 .jsonl이 인덱스와
+    다르면(다른 브랜치/리뷰에서 수정됨) 해당 cassette만 다시 반영한다.
+    .jsonl 없이 기존 YAML 파일만 있는 경우 YAML에서 읽어 점진적 마이그레이션을 허용한다.
+    """
+
+    def __init__(self, store: IndexedCassetteStore, library_dir: Path | str):
+        self.store = store
+        self.library_dir = Path(library_dir)
+
+    def cassette_key(self, cassette_path: Path | str) -> str:
+        path = Path(cassette_path)
+        if path.suffix in (".yaml", ".yml"):
+            path = path.with_suffix("")
+        try:
+            path = path.relative_to(self.library_dir)
+        except ValueError:
+            pass
+        return path.as_posix()
+
+    def export_path(self, key: str) -> Path:
+        return self.library_dir / f"{key}{EXPORT_SUFFIX}"
+
+    def load_cassette(self, cassette_path: Path | str, serializer: Any) -> tuple[list, list]:
+        key = self.cassette_key(cassette_path)
+        export_path = self.export_path(key)
+        if not export_path.is_file():
+            if not Path(cassette_path).is_file():
+                raise CassetteNotFoundError()
+            requests, responses = FilesystemPersister.load_cassette(cassette_path, serializer)
+            return requests, responses
+
+        source = _source_signature(export_path)
+        if self.store.source(key) != source:
+            self.store.save(key, read_jsonl_cassette(export_path), source)
+        interactions = self.store.load(key)
+        requests = [Request._from_dict(request) for request, _ in interactions]
+        responses = [compat.convert_to_bytes(response) for _, response in interactions]
+        return requests, responses
+
+    def save_cassette(
+        self, cassette_path: Path | str, cassette_dict: dict[str, list], serializer: Any
+    ) -> None:
+        interactions = [
+            (compat.convert_to_unicode(request._to_dict()), compat.convert_to_unicode(response))
+            for request, response in zip(
+                cassette_dict["requests"], cassette_dict["responses"], strict=False
+            )
+        ]
+        key = self.cassette_key(cassette_path)
+        export_path = self.export_path(key)
+        write_jsonl_cassette(export_path, interactions)
+        self.store.save(key, interactions, _source_signature(export_path))
+
+
+def _iter_yaml_cassettes(library_dir: Path) -> Iterator[Path]:
+    for pattern in ("*.yaml", "*.yml"):
+        yield from sorted(library_dir.rglob(pattern))
+
+
+def migrate_yaml_cassettes(
+    library_dir: Path,
+    persister: IndexedCassettePersister,
+    before_record_request: Hook | None = None,
+    before_record_response: Hook | None = None,
+    remove_yaml: bool = False,
+) -> int:
+    """
+    YAML cassette를 저장소로 이전
+
+    녹음 시와 동일하게 필터 훅을 적용하며, 훅이 None을 반환한 interaction은 제외한다.
+    이전한 cassette 수를 반환한다.
+    """
+    migrated = 0
+    for yaml_path in _iter_yaml_cassettes(library_dir):
+        requests, responses = FilesystemPersister.load_cassette(yaml_path, yamlserializer)
+
+        kept_requests, kept_responses = [], []
+        for request, response in zip(requests, responses, strict=False):
+            if before_record_request is not None:
+                request = before_record_request(request)
+            if before_record_response is not None and response is not None:
+                response = before_record_response(response)
+            if request is None or response is None:
+                continue
+            kept_requests.append(request)
+            kept_responses.append(response)
+
+        persister.save_cassette(
+            yaml_path, {"requests": kept_requests, "responses": kept_responses}, yamlserializer
+        )
+        if remove_yaml:
+            yaml_path.unlink()
+        migrated += 1
+    return migrated
+
+
+def _write_synthetic_cassettes(library_dir: Path, count: int, interactions: int = 5) -> None:
+    """벤치마크용 가상 YAML cassette 생성"""
+    for index in range(count):
+        requests, responses = [], []
+        for position in range(interactions):
+            body = json.dumps({"query": f"query {{ issue{index}_{position} {{ id title }} }}"})
+            requests.append(
+                Request(
+                    "POST",
+                    "https://api.example.com/graphql",
+                    body,
+                    {"Content-Type": "application/json", "Authorization": "[FILTERED]"},
+                )
+            )
+            payload = {"data": {"items": [{"id": i, "title": f"item {i}"} for i in range(50)]}}
+            responses.append(
+                {
+                    "status": {"code": 200, "message": "OK"},
+                    "headers": {"Content-Type": ["application/json"]},
+                    "body": {"string": json.dumps(payload).encode("utf-8")},
+                }
+            )
+        FilesystemPersister.save_cassette(
+            library_dir / f"synthetic_{index:05d}.yaml",
+            {"requests": requests, "responses": responses},
+            yamlserializer,
+        )
+
+
+def benchmark_replay(library_dir: Path, store_path: Path, rounds: int = 5) -> dict[str, float]:
+    """
+    YAML과 인덱스 저장소의 cassette 로딩(재생 준비) 시간 비교
+
+    library_dir의 YAML cassette를 저장소로 복사한 뒤 동일한 cassette 집합을
+    두 방식으로 rounds번 로딩하여 가장 빠른 회차 기준 시간을 반환한다.
+    """
+    yaml_paths = list(_iter_yaml_cassettes(library_dir))
+    with IndexedCassetteStore(store_path) as store:
+        persister = IndexedCassettePersister(store, library_dir)
+        migrate_yaml_cassettes(library_dir, persister)
+        store.compact()
+
+    yaml_times, store_times = [], []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for path in yaml_paths:
+            FilesystemPersister.load_cassette(path, yamlserializer)
+        yaml_times.append(time.perf_counter() - started)
+
+        # 매 회차 새 연결로 열어 콜드 로딩 비용까지 포함
+        started = time.perf_counter()
+        with IndexedCassetteStore(store_path) as store:
+            persister = IndexedCassettePersister(store, library_dir)
+            for path in yaml_paths:
+                persister.load_cassette(path, yamlserializer)
+        store_times.append(time.perf_counter() - started)
+
+    yaml_best, store_best = min(yaml_times), min(store_times)
+    return {
+        "cassettes": float(len(yaml_paths)),
+        "yaml_seconds": yaml_best,
+        "indexed_seconds": store_best,
+        "speedup": yaml_best / store_best if store_best else float("inf"),
+        "yaml_bytes": float(sum(path.stat().st_size for path in yaml_paths)),
+        "indexed_bytes": float(store_path.stat().st_size),
+    }
+
+
+def _load_conftest_hooks() -> tuple[Hook | None, Hook | None]:
+    """tests/conftest.py의 _filter_request/_filter_response를 가져옴"""
+    tests_dir = Path(__file__).resolve().parent.parent
+    if str(tests_dir) not in sys.path:
+        sys.path.insert(0, str(tests_dir))
+    import conftest
+
+    return (
+        getattr(conftest, "_filter_request", None),
+        getattr(conftest, "_filter_response", None),
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="VCR cassette 저장소 관리")
+    parser.add_argument(
+        "--library-dir",
+        type=Path,
+        default=DEFAULT_LIBRARY_DIR,
+        help="cassette 디렉토리 (기본값: tests/cassettes)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = subparsers.add_parser("migrate", help="YAML cassette를 저장소로 이전")
+    migrate_parser.add_argument("--remove-yaml", action="store_true", help="이전 후 YAML 파일 삭제")
+    subparsers.add_parser("compact", help="저장소 파일 정리 (WAL 반영 + VACUUM)")
+    bench_parser = subparsers.add_parser("bench", help="YAML 대비 재생 속도 비교")
+    bench_parser.add_argument("--rounds", type=int, default=5)
+    bench_parser.add_argument(
+        "--synthetic",
+        type=int,
+        default=0,
+        help="기존 cassette 대신 N개의 가상 cassette로 측정",
+    )
+
+    args = parser.parse_args(argv)
+    library_dir: Path = args.library_dir.resolve()
+    store_path = library_dir / STORE_FILENAME
+
+    if args.command == "migrate":
+        before_record_request, before_record_response = _load_conftest_hooks()
+        with IndexedCassetteStore(store_path) as store:
+            persister = IndexedCassettePersister(store, library_dir)
+            count = migrate_yaml_cassettes(
+                library_dir,
+                persister,
+                before_record_request=before_record_request,
+                before_record_response=before_record_response,
+                remove_yaml=args.remove_yaml,
+            )
+            store.compact()
+        print(f"Migrated {count} cassette(s) into {store_path}")
+        return 0
+
+    if args.command == "compact":
+        with IndexedCassetteStore(store_path) as store:
+            store.compact()
+        print(f"Compacted {store_path}")
+        return 0
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        bench_store = Path(work_dir) / STORE_FILENAME
+        bench_library = library_dir
+        if args.synthetic:
+            bench_library = Path(work_dir) / "cassettes"
+            bench_library.mkdir()
+            _write_synthetic_cassettes(bench_library, args.synthetic)
+        result = benchmark_replay(bench_library, bench_store, rounds=args.rounds)
+
+    print(f"cassettes      : {int(result['cassettes'])}")
+    print(
+        f"yaml           : {result['yaml_seconds'] * 1000:.1f} ms ({int(result['yaml_bytes'])} bytes)"
+    )
+    print(
+        f"indexed        : {result['indexed_seconds'] * 1000:.1f} ms "
+        f"({int(result['indexed_bytes'])} bytes)"
+    )
+    print(f"speedup        : {result['speedup']:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
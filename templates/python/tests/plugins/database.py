@@ -0,0 +1,161 @@
+"""
+SQLite 테스트 데이터베이스 헬퍼 (tests/integration/conftest.py에서 사용)
+
+- 스키마 + 시드 데이터를 템플릿 파일로 한 번만 생성 (xdist 워커 간 공유)
+- 각 워커는 SQLite backup API로 템플릿을 메모리 DB에 복사하여 독립적으로 사용
+- 각 테스트는 SAVEPOINT 안에서 실행 후 ROLLBACK → 테스트별 삭제/재생성 없음
+
+사용법 (테스트별 setup 비용 비교):
+    python tests/plugins/database.py bench [--iterations 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+# 예시 스키마/시드 - 실제 프로젝트 스키마로 교체하세요
+EXAMPLE_SCHEMA = """
+CREATE TABLE users (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE orders (
+    id INTEGER PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users (id),
+    amount INTEGER NOT NULL
+);
+
+CREATE INDEX idx_orders_user_id ON orders (user_id);
+
+WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < 1000)
+INSERT INTO users (id, name, email) SELECT n, 'user ' || n, 'user' || n || '@example.com' FROM seq;
+
+WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < 5000)
+INSERT INTO orders (id, user_id, amount) SELECT n, (n % 1000) + 1, n * 10 FROM seq;
+"""
+
+
+def build_template(path: Path, script: str) -> Path:
+    """
+    스키마/시드 스크립트로 템플릿 DB 파일 생성
+
+    임시 파일에 만든 뒤 os.replace로 교체하므로 여러 워커가 동시에 호출해도
+    항상 완성된 파일만 보인다. 이미 있으면 그대로 사용한다.
+    """
+    if path.exists():
+        return path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    connection = sqlite3.connect(tmp_path)
+    try:
+        connection.executescript(script)
+        connection.commit()
+    finally:
+        connection.close()
+    os.replace(tmp_path, path)
+    return path
+
+
+def clone_to_memory(template_path: Path) -> sqlite3.Connection:
+    """템플릿 DB를 backup API로 메모리 DB에 복사 (트랜잭션은 SAVEPOINT로 직접 관리)"""
+    source = sqlite3.connect(template_path)
+    target = sqlite3.connect(":memory:", isolation_level=None)
+    try:
+        source.backup(target)
+    finally:
+        source.close()
+    target.execute("PRAGMA foreign_keys = ON")
+    return target
+
+
+@contextmanager
+def savepoint(
+    connection: sqlite3.Connection, name: str = "test_case"
+) -> Iterator[sqlite3.Connection]:
+    """SAVEPOINT 안에서 실행하고 종료 시 모든 변경을 롤백"""
+    connection.execute(f"SAVEPOINT {name}")
+    try:
+        yield connection
+    finally:
+        connection.execute(f"ROLLBACK TO SAVEPOINT {name}")
+        connection.execute(f"RELEASE SAVEPOINT {name}")
+
+
+def _simulated_test(connection: sqlite3.Connection) -> None:
+    """벤치마크용: 테스트 한 건이 하는 일 (쓰기 1회 + 읽기 1회)"""
+    connection.execute(
+        "INSERT INTO users (name, email) VALUES (?, ?)", ("bench", "bench@example.com")
+    )
+    connection.execute("SELECT COUNT(*) FROM users").fetchone()
+
+
+def benchmark_setup(script: str = EXAMPLE_SCHEMA, iterations: int = 200) -> dict[str, float]:
+    """
+    테스트별 setup/teardown 비용 비교 (초/테스트)
+
+    naive: 테스트마다 DB 파일 생성 → 스키마/시드 → 삭제
+    savepoint: 세션당 템플릿 1회 생성 + 메모리 복제, 테스트마다 SAVEPOINT/ROLLBACK
+    """
+    with tempfile.TemporaryDirectory() as work_dir:
+        work = Path(work_dir)
+
+        started = time.perf_counter()
+        for index in range(iterations):
+            db_path = work / f"naive_{index}.db"
+            connection = sqlite3.connect(db_path)
+            connection.executescript(script)
+            _simulated_test(connection)
+            connection.close()
+            db_path.unlink()
+        naive = (time.perf_counter() - started) / iterations
+
+        started = time.perf_counter()
+        connection = clone_to_memory(build_template(work / "template.db", script))
+        session_setup = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            with savepoint(connection):
+                _simulated_test(connection)
+        per_test = (time.perf_counter() - started) / iterations
+        connection.close()
+
+    return {
+        "iterations": float(iterations),
+        "naive_per_test": naive,
+        "savepoint_session_setup": session_setup,
+        "savepoint_per_test": per_test,
+        "speedup": naive / per_test if per_test else float("inf"),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="SQLite 테스트 DB 헬퍼")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    bench_parser = subparsers.add_parser(
+        "bench", help="naive create/drop 대비 테스트별 setup 비용 비교"
+    )
+    bench_parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    result = benchmark_setup(iterations=args.iterations)
+    print(f"iterations             : {int(result['iterations'])}")
+    print(f"naive create/drop      : {result['naive_per_test'] * 1e3:8.3f} ms/test")
+    print(f"template + clone       : {result['savepoint_session_setup'] * 1e3:8.3f} ms/session")
+    print(f"savepoint rollback     : {result['savepoint_per_test'] * 1e3:8.3f} ms/test")
+    print(f"speedup (per test)     : {result['speedup']:.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
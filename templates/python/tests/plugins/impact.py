@@ -0,0 +1,383 @@
+"""
+커버리지 기반 변경 영향 테스트 선택 (test impact analysis)
+
+- `--cov-context=test`로 전체 실행 시 테스트별 커버리지 context로 "소스 라인 → 테스트" 맵을 만들어
+  .pytest-impact.json에 캐시
+- `--impact` 실행 시 맵을 만든 커밋 기준 git diff의 변경 라인을 실행한 테스트만 선택
+- 변경된 테스트 파일, 맵에 없는 새 테스트는 항상 실행
+- conftest.py, 설정 파일(pyproject.toml, pytest.ini 등), 테스트 플러그인,
+  테스트 디렉토리의 데이터 파일(cassette 등 .py가 아닌 파일)이 바뀌었거나 맵이 없으면 전체 테스트로 fallback
+
+사용법:
+    pytest --cov-context=test     # 맵 생성/갱신 (전체 실행)
+    pytest --impact               # 변경 영향 테스트만 실행
+"""
+
+from __future__ import annotations
+
+import bisect
+import fnmatch
+import json
+import os
+import re
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+MAP_VERSION = 1
+
+# 모듈 import 시점(테스트 context 없음)에 실행된 라인 표시 → 파일을 쓰는 모든 테스트에 영향
+IMPORT_TIME = -1
+
+_HUNK_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+\d+(?:,\d+)? @@")
+# ---/+++ 줄이 없는 변경 (바이너리 파일, 내용 변경 없는 이름 변경)
+_BINARY_RE = re.compile(r"^Binary files (.+) and (.+) differ$")
+_RENAME_RE = re.compile(r"^rename (?:from|to) (.+)$")
+
+# 파일 경로 -> 변경된 (맵 기준) 라인 번호, None이면 파일 전체
+Changes = dict[str, set[int] | None]
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("impact", "변경 영향 테스트 선택")
+    group.addoption(
+        "--impact",
+        action="store_true",
+        default=False,
+        help="git diff로 변경된 코드를 실행하는 테스트만 선택",
+    )
+    group.addoption(
+        "--impact-base",
+        action="store",
+        default=None,
+        help="diff 기준 git ref (기본값: 맵을 생성한 커밋)",
+    )
+    parser.addini(
+        "impact_map",
+        "테스트 영향 맵 캐시 파일 경로 (rootdir 기준)",
+        default=".pytest-impact.json",
+    )
+    parser.addini(
+        "impact_full_run_patterns",
+        "변경 시 전체 테스트로 fallback할 파일 패턴",
+        type="linelist",
+        default=[
+            "conftest.py",
+            "pyproject.toml",
+            "pytest.ini",
+            "setup.cfg",
+            "tox.ini",
+            ".coveragerc",
+            "uv.lock",
+            "requirements*.txt",
+            "tests/plugins/*",
+        ],
+    )
+    parser.addini(
+        "impact_data_dirs",
+        "커버리지로 테스트를 알 수 없는 데이터 파일(.py 외)이 변경되면 전체 실행할 디렉토리",
+        type="linelist",
+        default=["tests"],
+    )
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(ImpactSelector(config), "impact_selector")
+
+
+def _git(args: list[str], cwd: Path) -> str | None:
+    try:
+        result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout
+
+
+def _diff_path(path: str, prefix: str) -> str | None:
+    if path == "/dev/null":
+        return None
+    return path[len(prefix) :] if path.startswith(prefix) else path
+
+
+def parse_diff(diff: str) -> Changes:
+    """
+    `git diff -U0` 출력에서 변경 전(old) 기준 라인 번호 추출
+
+    삭제/추가된 파일, 이름이 바뀐 파일, 바이너리 파일은 파일 전체(None)로 취급한다.
+    순수 추가 hunk(-a,0)는 삽입 위치 앞뒤 라인(a, a+1)을 변경으로 본다.
+    """
+    changes: Changes = {}
+    old_path: str | None = None
+    current: str | None = None
+    # hunk 안의 "-- ..."(삭제된 SQL 주석 등)을 파일 헤더로 오인하지 않도록 헤더 구간만 해석
+    in_header = True
+    for line in diff.splitlines():
+        if line.startswith("diff --git "):
+            in_header = True
+            old_path = current = None
+            continue
+        if not in_header:
+            match = _HUNK_RE.match(line)
+            lines = changes.get(current) if current is not None else None
+            if match and lines is not None:
+                start = int(match.group(1))
+                count = int(match.group(2)) if match.group(2) is not None else 1
+                lines.update(range(start, start + 2) if count == 0 else range(start, start + count))
+            continue
+        if line.startswith("--- "):
+            old_path = _diff_path(line[len("--- ") :], "a/")
+            continue
+        if line.startswith("+++ "):
+            in_header = False
+            new_path = _diff_path(line[len("+++ ") :], "b/")
+            current = old_path or new_path
+            if current is None:
+                continue
+            if old_path is None or new_path is None or old_path != new_path:
+                changes[current] = None
+                if new_path and new_path != current:
+                    changes[new_path] = None
+            else:
+                changes.setdefault(current, set())
+            continue
+        binary = _BINARY_RE.match(line)
+        rename = _RENAME_RE.match(line)
+        if binary:
+            paths = [_diff_path(binary.group(1), "a/"), _diff_path(binary.group(2), "b/")]
+        elif rename:
+            paths = [rename.group(1)]
+        else:
+            paths = []
+        for path in paths:
+            if path is not None:
+                changes[path] = None
+    return changes
+
+
+def changed_lines(rootdir: Path, base: str) -> Changes | None:
+    """base 커밋 대비 작업 트리 변경 (추적되지 않는 새 파일 포함), git 실패 시 None"""
+    diff = _git(["diff", "-U0", "--no-color", "--no-ext-diff", "--relative", base], rootdir)
+    untracked = _git(["ls-files", "--others", "--exclude-standard"], rootdir)
+    if diff is None or untracked is None:
+        return None
+    changes = parse_diff(diff)
+    for path in untracked.splitlines():
+        changes[path] = None
+    return changes
+
+
+def full_run_trigger(
+    changes: Changes, patterns: list[str], data_dirs: list[str] | None = None
+) -> str | None:
+    """전체 실행이 필요한 변경 파일 (없으면 None)"""
+    prefixes = [data_dir.rstrip("/") + "/" for data_dir in data_dirs or []]
+    for path in sorted(changes):
+        name = path.rsplit("/", 1)[-1]
+        for pattern in patterns:
+            if fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(name, pattern):
+                return path
+        # cassette, 테스트 데이터 등은 커버리지 맵에 없어 영향받는 테스트를 알 수 없음
+        if not path.endswith(".py") and any(path.startswith(prefix) for prefix in prefixes):
+            return path
+    return None
+
+
+def build_impact_map(
+    data: Any,
+    rootdir: Path,
+    commit: str | None,
+    dirty: bool,
+    executed: list[str] | None = None,
+) -> dict[str, Any]:
+    """
+    coverage CoverageData(테스트 context 포함)로 라인 → 테스트 인덱스 맵 생성
+
+    executed: 이번 실행에서 돌린 전체 테스트 (소스 라인을 실행하지 않은 테스트도 "알려진 테스트"로 기록)
+    """
+    test_index: dict[str, int] = {nodeid: index for index, nodeid in enumerate(executed or [])}
+    files: dict[str, dict[str, list[int]]] = {}
+    for filename in data.measured_files():
+        relpath = Path(os.path.relpath(filename, rootdir)).as_posix()
+        lines: dict[str, list[int]] = {}
+        for lineno, contexts in data.contexts_by_lineno(filename).items():
+            ids = set()
+            for context in contexts:
+                if not context:
+                    ids.add(IMPORT_TIME)
+                    continue
+                nodeid = context.rsplit("|", 1)[0]
+                ids.add(test_index.setdefault(nodeid, len(test_index)))
+            if ids:
+                lines[str(lineno)] = sorted(ids)
+        if lines:
+            files[relpath] = lines
+    return {
+        "version": MAP_VERSION,
+        "commit": commit,
+        "dirty": dirty,
+        "tests": sorted(test_index, key=test_index.__getitem__),
+        "files": files,
+    }
+
+
+def load_impact_map(path: Path) -> dict[str, Any] | None:
+    try:
+        impact_map = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(impact_map, dict) or impact_map.get("version") != MAP_VERSION:
+        return None
+    return impact_map
+
+
+def affected_tests(impact_map: dict[str, Any], changes: Changes) -> set[str]:
+    """변경 라인을 실행한 테스트 nodeid 집합"""
+    tests = impact_map["tests"]
+    hit: set[int] = set()
+    for path, lines in changes.items():
+        file_map = impact_map["files"].get(path)
+        if not file_map:
+            continue
+        every_test = {index for ids in file_map.values() for index in ids}
+        if lines is None or impact_map.get("dirty"):
+            hit |= every_test
+            continue
+
+        mapped = sorted(int(lineno) for lineno in file_map)
+        for lineno in lines:
+            # 주석/빈 줄처럼 실행되지 않는 라인이면 앞뒤의 가장 가까운 실행 라인을 사용
+            if str(lineno) in file_map:
+                candidates = [lineno]
+            else:
+                position = bisect.bisect_left(mapped, lineno)
+                candidates = mapped[max(position - 1, 0) : position + 1]
+            for candidate in candidates:
+                ids = file_map[str(candidate)]
+                if IMPORT_TIME in ids:
+                    hit |= every_test
+                else:
+                    hit.update(ids)
+    return {tests[index] for index in hit if index != IMPORT_TIME}
+
+
+class ImpactSelector:
+    """--impact 테스트 선택과 영향 맵 갱신"""
+
+    def __init__(self, config: pytest.Config):
+        self.config = config
+        self.rootdir = Path(config.rootpath)
+        path = Path(config.getini("impact_map"))
+        self.path = path if path.is_absolute() else self.rootdir / path
+        self.enabled = config.getoption("--impact")
+        self.is_worker = hasattr(config, "workerinput")
+
+        # 로컬 반복용 모드: 일부 테스트만 실행하므로 전체 커버리지 기준(--cov-fail-under)은 적용하지 않음
+        # (xdist controller는 선택 결과를 알 수 없으므로 fallback 여부와 관계없이 끔)
+        cov_options = getattr(config.pluginmanager.getplugin("_cov"), "options", None)
+        if (
+            self.enabled
+            and cov_options is not None
+            and getattr(cov_options, "cov_fail_under", None)
+        ):
+            cov_options.cov_fail_under = 0
+
+        self.fallback_reason: str | None = None
+        self.selected = 0
+        self.deselected = 0
+        self.rebuilt: int | None = None
+        self.executed: dict[str, None] = {}
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        if not self.enabled:
+            return
+
+        impact_map = load_impact_map(self.path)
+        if impact_map is None:
+            self.fallback_reason = f"{self.path.name} 없음 (pytest --cov-context=test 로 생성)"
+            return
+        base = config.getoption("--impact-base") or impact_map.get("commit")
+        changes = changed_lines(self.rootdir, base) if base else None
+        if changes is None:
+            self.fallback_reason = f"git diff 실패 (base: {base})"
+            return
+        trigger = full_run_trigger(
+            changes, config.getini("impact_full_run_patterns"), config.getini("impact_data_dirs")
+        )
+        if trigger is not None:
+            self.fallback_reason = f"{trigger} 변경"
+            return
+
+        affected = affected_tests(impact_map, changes)
+        known = set(impact_map["tests"])
+        selected, deselected = [], []
+        for item in items:
+            test_file = item.nodeid.split("::", 1)[0]
+            if item.nodeid in affected or item.nodeid not in known or test_file in changes:
+                selected.append(item)
+            else:
+                deselected.append(item)
+
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        self.selected, self.deselected = len(selected), len(deselected)
+
+    def pytest_runtest_logreport(self, report):
+        if report.when == "call" or (report.when == "setup" and report.skipped):
+            self.executed.setdefault(report.nodeid)
+
+    def _should_rebuild(self, exitstatus: int) -> bool:
+        option = self.config.option
+        # 맵은 --impact 없이 전체를 실행했을 때만 갱신 (xdist controller는 워커의 선택 결과를 모름)
+        return (
+            not self.is_worker
+            and not self.enabled
+            and getattr(option, "cov_context", None) == "test"
+            and not option.keyword
+            and not option.markexpr
+            and exitstatus in (pytest.ExitCode.OK, pytest.ExitCode.TESTS_FAILED)
+        )
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        if not self._should_rebuild(exitstatus):
+            return
+        cov_plugin = self.config.pluginmanager.getplugin("_cov")
+        controller = getattr(cov_plugin, "cov_controller", None)
+        if controller is None:
+            return
+
+        data = controller.cov.get_data()
+        commit = (_git(["rev-parse", "HEAD"], self.rootdir) or "").strip() or None
+        modified = _git(["diff", "--name-only", "--relative", "HEAD"], self.rootdir) or ""
+        measured = {
+            Path(os.path.relpath(filename, self.rootdir)).as_posix()
+            for filename in data.measured_files()
+        }
+        # 측정 대상 소스가 커밋되지 않은 상태면 라인 번호가 커밋과 달라 파일 단위로만 선택
+        dirty = bool(measured & set(modified.splitlines()))
+        impact_map = build_impact_map(
+            data, self.rootdir, commit, dirty=dirty, executed=list(self.executed)
+        )
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(impact_map, separators=(",", ":")), encoding="utf-8")
+        self.rebuilt = len(impact_map["tests"])
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.is_worker:
+            return
+        # xdist 사용 시 선택은 워커에서 이루어지므로 controller에는 결과가 없음
+        if self.enabled and (self.fallback_reason or self.selected or self.deselected):
+            if self.fallback_reason:
+                terminalreporter.write_line(f"test impact: 전체 실행 ({self.fallback_reason})")
+            else:
+                terminalreporter.write_line(
+                    f"test impact: {self.selected}개 선택, {self.deselected}개 제외"
+                )
+        if self.rebuilt is not None:
+            terminalreporter.write_line(
+                f"test impact: 맵 갱신 ({self.rebuilt} tests) -> {self.path}"
+            )
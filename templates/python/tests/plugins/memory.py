@@ -0,0 +1,522 @@
+"""
+테스트/픽스처 메모리 측정 플러그인 (--memory, 기본 비활성)
+
+- tracemalloc으로 테스트별 peak/retained 메모리와 RSS 변화를 기록
+  (retained = teardown 후에도 남아 있는 할당, peak = 실행 중 최대 증가량)
+- 세션/모듈 스코프 픽스처의 setup peak, setup 후 retained, teardown 후 retained 기록
+- call에서 임계값 이상을 남긴 테스트를 leak 후보로 표시
+- --memory-leak-runs=N을 지정하면 후보 테스트의 call을 N번 더 실행하여 매번 메모리가 늘어나면 leak으로 표시
+  (테스트 본문이 여러 번 실행되므로 별도 opt-in, 기본 0)
+- 세션 종료 시 leak 의심 테스트의 할당 위치와 세션 전체 증가량 상위 할당 위치를 출력
+
+tracemalloc 오버헤드와 leak 재실행이 실행 시간을 왜곡하므로 --memory 실행은
+plugins/timing.py의 history에 기록하지 않는다.
+
+사용법:
+    pytest --memory                              # 측정 + 요약 출력
+    pytest --memory --memory-report=memory.json  # nightly artifact로 JSON 저장
+    pytest --memory --memory-frames=10           # 할당 위치 traceback 깊이 (기본 1, 느려짐)
+    pytest --memory --memory-leak-runs=3         # leak 후보 재실행으로 확인
+
+오버헤드를 낮추기 위해 테스트별 측정은 tracemalloc.get_traced_memory()만 사용하고
+snapshot은 세션 시작/종료와 leak 재실행 시에만 만든다. gc.collect()는 call이 임계값 이상을 남겼을 때만 실행한다.
+실행 시간은 대부분 tracemalloc 자체 비용이다 (빈 테스트 2000개: 기본 약 2 s,
+PYTHONTRACEMALLOC=1 약 9-10 s, --memory 약 11-12 s).
+pytest-xdist 사용 시 워커별로 측정하고 workeroutput으로 controller에 전달한다.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from plugins.timing import disable_history, fixture_key
+
+REPORT_VERSION = 3
+
+# snapshot 비교에서 제외할 할당 위치 (측정 도구 자체, import 시스템)
+_IGNORED_FILES = (
+    tracemalloc.__file__,
+    __file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>",
+)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("memory", "메모리 측정")
+    group.addoption(
+        "--memory",
+        action="store_true",
+        default=False,
+        help="테스트/픽스처별 메모리(tracemalloc, RSS) 측정 및 leak 검사",
+    )
+    group.addoption(
+        "--memory-report",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="측정 결과를 JSON으로 저장",
+    )
+    group.addoption(
+        "--memory-frames",
+        action="store",
+        type=int,
+        default=None,
+        help="할당 위치 traceback 깊이 (기본값: ini memory_frames)",
+    )
+    group.addoption(
+        "--memory-leak-runs",
+        action="store",
+        type=int,
+        default=None,
+        metavar="N",
+        help="leak 후보 테스트의 call을 N번 더 실행하여 확인 (기본값: ini memory_leak_runs)",
+    )
+    parser.addini("memory_frames", "tracemalloc traceback 깊이", default="1")
+    parser.addini(
+        "memory_leak_threshold",
+        "leak 검사 기준 - call 1회가 남기는 메모리 (bytes)",
+        default="65536",
+    )
+    parser.addini(
+        "memory_leak_runs",
+        "leak 후보 확인을 위한 call 재실행 횟수 (0이면 재실행 안 함)",
+        default="0",
+    )
+    parser.addini("memory_top", "요약에 출력할 테스트/할당 위치 수", default="10")
+
+
+def pytest_configure(config):
+    if config.getoption("--memory"):
+        config.pluginmanager.register(MemoryRecorder(config), "memory_recorder")
+        disable_history(config)
+
+
+def current_rss() -> int | None:
+    """현재 프로세스 RSS (bytes) - /proc이 없는 플랫폼에서는 None"""
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def format_bytes(value: float, sign: bool = True) -> str:
+    """바이트 수를 읽기 쉬운 단위로 (sign=True이면 증감 부호 표시)"""
+    prefix = "-" if value < 0 else ("+" if sign else "")
+    size = abs(value)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024 or unit == "GiB":
+            break
+        size /= 1024
+    return f"{prefix}{size:.0f} {unit}" if unit == "B" else f"{prefix}{size:.1f} {unit}"
+
+
+def top_sites(
+    before: tracemalloc.Snapshot, after: tracemalloc.Snapshot, limit: int
+) -> list[dict[str, Any]]:
+    """before 대비 after에서 가장 많이 늘어난 할당 위치"""
+    filters = [tracemalloc.Filter(False, filename) for filename in _IGNORED_FILES]
+    stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), "traceback")
+    sites = []
+    for stat in stats:
+        if stat.size_diff <= 0:
+            continue
+        sites.append(
+            {
+                "site": [f"{frame.filename}:{frame.lineno}" for frame in stat.traceback],
+                "size": stat.size_diff,
+                "count": stat.count_diff,
+            }
+        )
+        if len(sites) >= limit:
+            break
+    return sites
+
+
+class _Region:
+    """측정 구간 - 시작 시점 traced 메모리와 구간 내 최대값"""
+
+    __slots__ = ("start", "peak")
+
+    def __init__(self, start: int):
+        self.start = start
+        self.peak = start
+
+
+class MemoryRecorder:
+    """테스트/픽스처 메모리 측정, leak 검사, 요약/리포트"""
+
+    def __init__(self, config: pytest.Config):
+        self.config = config
+        self.is_worker = hasattr(config, "workerinput")
+        # xdist controller는 테스트를 실행하지 않으므로 워커 결과만 모음
+        self.is_controller = not self.is_worker and config.getoption("dist", "no") != "no"
+        frames = config.getoption("--memory-frames")
+        self.frames = frames if frames is not None else int(config.getini("memory_frames"))
+        self.leak_threshold = int(config.getini("memory_leak_threshold"))
+        leak_runs = config.getoption("--memory-leak-runs")
+        self.leak_runs = (
+            leak_runs if leak_runs is not None else int(config.getini("memory_leak_runs"))
+        )
+        self.top = int(config.getini("memory_top"))
+
+        self.tests: dict[str, dict[str, Any]] = {}
+        self.fixtures: dict[str, dict[str, Any]] = {}
+        # 워커 이름(xdist가 아니면 "main") -> 세션 정보
+        self.sessions: dict[str, dict[str, Any]] = {}
+
+        self._regions: list[_Region] = []
+        self._teardown_started: dict[str, int] = {}
+        # teardown이 끝났지만 pytest가 아직 값을 참조하는 픽스처 (key, teardown 시작 시점 traced)
+        self._pending_release: tuple[str, int] | None = None
+        self._item: pytest.Item | None = None
+        # 현재 테스트의 retained에서 제외할 메모리 (세션/모듈 픽스처 setup/teardown, leak 재실행)
+        self._excluded = 0
+        self._baseline: tracemalloc.Snapshot | None = None
+        self._started_tracing = False
+        self._rss_start: int | None = None
+
+    # --- 구간 측정 (중첩 가능: 바깥 구간의 peak도 함께 갱신) ---
+
+    def _update_peaks(self) -> int:
+        current, peak = tracemalloc.get_traced_memory()
+        for region in self._regions:
+            region.peak = max(region.peak, peak)
+        tracemalloc.reset_peak()
+        return current
+
+    def _enter(self) -> _Region:
+        region = _Region(self._update_peaks())
+        self._regions.append(region)
+        return region
+
+    def _exit(self, region: _Region, collect_at: int | None = None) -> tuple[int, int]:
+        """
+        (peak 증가량, retained)
+
+        retained가 collect_at 이상이면 gc 후 다시 계산한다 (순환 참조 garbage를 leak으로 보지 않도록).
+        gc.collect()는 테스트마다 수십 ms가 걸리므로 임계값을 넘은 구간에서만 실행한다.
+        """
+        self._update_peaks()
+        self._regions.remove(region)
+        current, _peak = tracemalloc.get_traced_memory()
+        if collect_at is not None and current - region.start >= collect_at:
+            gc.collect()
+            current, _peak = tracemalloc.get_traced_memory()
+        return region.peak - region.start, current - region.start
+
+    # --- 세션 ---
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session):
+        if self.is_controller:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        self._rss_start = current_rss()
+        gc.collect()
+        self._baseline = tracemalloc.take_snapshot()
+
+    # --- 테스트 ---
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        if not tracemalloc.is_tracing():
+            yield
+            return
+        rss_before = current_rss()
+        self._excluded = 0
+        self._item = item
+        region = self._enter()
+        yield
+        self._settle_release()
+        self._item = None
+        peak, retained = self._exit(region)
+        rss_after = current_rss()
+        record = self.tests.setdefault(item.nodeid, {})
+        record["peak"] = peak
+        record["retained"] = retained - self._excluded
+        if rss_before is not None and rss_after is not None:
+            record["rss_delta"] = rss_after - rss_before
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        if not tracemalloc.is_tracing():
+            yield
+            return
+        region = self._enter()
+        outcome = yield
+        _peak, retained = self._exit(region, collect_at=self.leak_threshold)
+        record = self.tests.setdefault(item.nodeid, {})
+        record["call_retained"] = retained
+        if outcome.excinfo is None and retained >= self.leak_threshold:
+            record["leak_candidate"] = True
+            if self.leak_runs > 0:
+                self._check_leak(item, record)
+
+    def _check_leak(self, item: pytest.Item, record: dict[str, Any]) -> None:
+        """
+        call을 leak_runs번 더 실행하여 매번 임계값 이상 남기면 leak으로 표시
+
+        첫 실행은 캐시/지연 초기화 때문에 남는 메모리가 있을 수 있으므로 재실행만 판정에 사용한다.
+        픽스처는 다시 만들지 않으므로 픽스처 상태를 누적하는 테스트도 표시될 수 있고,
+        재실행에 실패하는 테스트는 판정하지 않는다 (테스트 결과에는 영향 없음, 요약과 리포트에 오류 기록).
+        """
+        runs = []
+        before = tracemalloc.take_snapshot()
+        try:
+            for _ in range(self.leak_runs):
+                start, _peak = tracemalloc.get_traced_memory()
+                item.runtest()
+                gc.collect()
+                current, _peak = tracemalloc.get_traced_memory()
+                runs.append(current - start)
+        except Exception as error:
+            record["leak_check_error"] = f"{type(error).__name__}: {error}"
+            return
+        record["leak_runs"] = runs
+        self._excluded += sum(runs)
+        if all(retained >= self.leak_threshold for retained in runs):
+            record["leak_sites"] = top_sites(before, tracemalloc.take_snapshot(), 5)
+
+    # --- 픽스처 (function 스코프 제외) ---
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        if fixturedef.scope == "function" or not tracemalloc.is_tracing():
+            yield
+            return
+        key = fixture_key(fixturedef)
+        region = self._enter()
+        yield
+        peak, retained = self._exit(region)
+        self._excluded += retained
+        self.fixtures[key] = {
+            "name": fixturedef.argname,
+            "scope": fixturedef.scope,
+            "setup_peak": peak,
+            "setup_retained": retained,
+            "teardown_retained": None,
+        }
+        fixturedef.addfinalizer(lambda: self._teardown_start(key))
+
+    def _teardown_start(self, key: str) -> None:
+        self._settle_release()
+        self._teardown_started[key] = tracemalloc.get_traced_memory()[0]
+
+    def pytest_fixture_post_finalizer(self, fixturedef, request):
+        key = fixture_key(fixturedef)
+        started = self._teardown_started.pop(key, None)
+        if started is None or key not in self.fixtures or not tracemalloc.is_tracing():
+            return
+        # post_finalizer 시점에는 fixturedef.cached_result가 아직 값을 참조하므로
+        # 다음 픽스처 teardown이 시작되거나 테스트가 끝날 때 해제된 양을 계산
+        self._settle_release()
+        self._pending_release = (key, started)
+        # 현재 테스트의 item.funcargs도 teardown 전체가 끝날 때까지 값을 참조하므로 (pytest가 곧 비움)
+        # 끝난 픽스처의 항목을 먼저 지워 해제가 이 픽스처에 기록되도록 함
+        funcargs = getattr(self._item, "funcargs", None)
+        cached = fixturedef.cached_result
+        if funcargs and cached is not None and cached[2] is None:
+            if funcargs.get(fixturedef.argname) is cached[0]:
+                del funcargs[fixturedef.argname]
+
+    def _settle_release(self) -> None:
+        """teardown이 해제한 양만 setup retained에서 뺌 (다른 테스트의 할당과 섞이지 않도록)"""
+        if self._pending_release is None:
+            return
+        key, started = self._pending_release
+        self._pending_release = None
+        released = tracemalloc.get_traced_memory()[0] - started
+        self._excluded += released
+        record = self.fixtures[key]
+        record["teardown_retained"] = record["setup_retained"] + released
+
+    # --- 세션 종료, xdist 병합 ---
+
+    def _finish_tracing(self) -> dict[str, Any] | None:
+        if self._baseline is None:
+            return None
+        self._settle_release()
+        gc.collect()
+        current, _peak = tracemalloc.get_traced_memory()
+        sites = top_sites(self._baseline, tracemalloc.take_snapshot(), self.top)
+        self._baseline = None
+        if self._started_tracing:
+            tracemalloc.stop()
+        return {
+            "traced_end": current,
+            "rss_start": self._rss_start,
+            "rss_end": current_rss(),
+            "sites": sites,
+        }
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        output = getattr(node, "workeroutput", {}).get("memory")
+        if not output:
+            return
+        self.tests.update(output["tests"])
+        for key, record in output["fixtures"].items():
+            self.fixtures[f"{node.gateway.id}:{key}"] = {**record, "worker": node.gateway.id}
+        if output["session"]:
+            self.sessions[node.gateway.id] = output["session"]
+
+    def pytest_sessionfinish(self, session):
+        result = self._finish_tracing()
+        if self.is_worker:
+            self.config.workeroutput["memory"] = {  # type: ignore[attr-defined]
+                "tests": self.tests,
+                "fixtures": self.fixtures,
+                "session": result,
+            }
+            return
+        if result:
+            self.sessions["main"] = result
+        path = self.config.getoption("--memory-report")
+        if path:
+            self._write_report(Path(path))
+
+    def leak_candidates(self) -> list[tuple[str, dict[str, Any]]]:
+        """call이 임계값 이상을 남겼지만 재실행으로 확인하지 않은 테스트"""
+        return sorted(
+            (
+                (nodeid, record)
+                for nodeid, record in self.tests.items()
+                if record.get("leak_candidate")
+                and "leak_runs" not in record
+                and "leak_check_error" not in record
+            ),
+            key=lambda row: row[1]["call_retained"],
+            reverse=True,
+        )
+
+    def leak_check_errors(self) -> list[tuple[str, dict[str, Any]]]:
+        """leak 재실행이 실패해 판정하지 못한 테스트"""
+        return sorted(
+            (nodeid, record)
+            for nodeid, record in self.tests.items()
+            if "leak_check_error" in record
+        )
+
+    def leaks(self) -> list[tuple[str, dict[str, Any]]]:
+        return sorted(
+            ((nodeid, record) for nodeid, record in self.tests.items() if "leak_sites" in record),
+            key=lambda row: min(row[1]["leak_runs"]),
+            reverse=True,
+        )
+
+    def session_sites(self) -> list[dict[str, Any]]:
+        """워커별 상위 할당 위치를 위치 기준으로 합산"""
+        merged: dict[tuple[str, ...], dict[str, Any]] = {}
+        for info in self.sessions.values():
+            for site in info["sites"]:
+                entry = merged.setdefault(
+                    tuple(site["site"]), {"site": site["site"], "size": 0, "count": 0}
+                )
+                entry["size"] += site["size"]
+                entry["count"] += site["count"]
+        return sorted(merged.values(), key=lambda site: site["size"], reverse=True)[: self.top]
+
+    def _write_report(self, path: Path) -> None:
+        payload = {
+            "version": REPORT_VERSION,
+            "frames": self.frames,
+            "leak_threshold": self.leak_threshold,
+            "leak_runs": self.leak_runs,
+            "sessions": self.sessions,
+            "tests": self.tests,
+            "fixtures": self.fixtures,
+            "leaks": [nodeid for nodeid, _record in self.leaks()],
+            "leak_candidates": [nodeid for nodeid, _record in self.leak_candidates()],
+            "leak_check_errors": [nodeid for nodeid, _record in self.leak_check_errors()],
+            "sites": self.session_sites(),
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, indent=1, sort_keys=True), encoding="utf-8")
+
+    # --- 요약 출력 ---
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.is_worker or not self.tests:
+            return
+        write = terminalreporter.write_line
+        terminalreporter.section("memory")
+
+        for name, info in sorted(self.sessions.items()):
+            rss = ""
+            if info["rss_start"] is not None and info["rss_end"] is not None:
+                rss_start = format_bytes(info["rss_start"], sign=False)
+                rss_end = format_bytes(info["rss_end"], sign=False)
+                rss_delta = format_bytes(info["rss_end"] - info["rss_start"])
+                rss = f", RSS {rss_start} -> {rss_end} ({rss_delta})"
+            write(f"{name}: traced at end {format_bytes(info['traced_end'], sign=False)}{rss}")
+
+        retained = sorted(self.tests.items(), key=lambda kv: kv[1].get("retained", 0), reverse=True)
+        write("largest retained (setup..teardown):")
+        for nodeid, record in retained[: self.top]:
+            delta = record.get("rss_delta")
+            rss = format_bytes(delta) if delta is not None else "-"
+            write(
+                f"  {format_bytes(record.get('retained', 0)):>12}  "
+                f"peak {format_bytes(record.get('peak', 0)):>12}  rss {rss:>12}  {nodeid}"
+            )
+
+        if self.fixtures:
+            write("fixtures (setup peak / retained after setup / after teardown):")
+            ordered = sorted(
+                self.fixtures.items(), key=lambda kv: kv[1]["setup_retained"], reverse=True
+            )
+            for _key, record in ordered[: self.top]:
+                teardown = record["teardown_retained"]
+                after = format_bytes(teardown) if teardown is not None else "-"
+                worker = f" ({record['worker']})" if "worker" in record else ""
+                write(
+                    f"  {format_bytes(record['setup_peak']):>12} "
+                    f"{format_bytes(record['setup_retained']):>12} {after:>12}  "
+                    f"{record['name']} [{record['scope']}]{worker}"
+                )
+
+        leaks = self.leaks()
+        if leaks:
+            threshold = format_bytes(self.leak_threshold, sign=False)
+            write(f"possible leaks (each of {self.leak_runs} reruns retained >= {threshold}):")
+            for nodeid, record in leaks:
+                per_run = ", ".join(format_bytes(value) for value in record["leak_runs"])
+                write(f"  {nodeid}  [{per_run}]")
+                for site in record["leak_sites"]:
+                    write(f"    {format_bytes(site['size']):>12}  {site['site'][0]}")
+
+        candidates = self.leak_candidates()
+        if candidates:
+            threshold = format_bytes(self.leak_threshold, sign=False)
+            hint = "" if self.leak_runs else " - confirm with --memory-leak-runs=3"
+            write(f"leak candidates (call retained >= {threshold}{hint}):")
+            for nodeid, record in candidates[: self.top]:
+                write(f"  {format_bytes(record['call_retained']):>12}  {nodeid}")
+
+        errors = self.leak_check_errors()
+        if errors:
+            write("leak check failed (rerun raised, not judged):")
+            for nodeid, record in errors:
+                write(f"  {format_bytes(record['call_retained']):>12}  {nodeid}")
+                write(f"    {record['leak_check_error'].splitlines()[0]}")
+
+        sites = self.session_sites()
+        if sites:
+            write("top allocation sites (session growth):")
+            for site in sites:
+                write(
+                    f"  {format_bytes(site['size']):>12} {site['count']:>8} blocks  "
+                    f"{site['site'][0]}"
+                )
@@ -0,0 +1,225 @@
+"""
+실행 시간 기반 pytest-xdist 스케줄러
+
+- plugins/timing.py가 기록한 history(.pytest-timings.json)로 테스트별 예상 시간 계산
+- 예상 시간이 긴 작업 단위부터 먼저 배정 (longest-first list scheduling)
+- 무거운 세션 픽스처를 쓰는 디렉토리(기본: tests/integration, tests/e2e)는
+  하나의 작업 단위로 묶어 같은 워커에서 실행 → database_connection, app_server 등의
+  세션 setup이 워커마다 반복되지 않음
+- 세션 종료 시 워커별 사용률과 예상 wall-clock 절감 시간을 출력
+
+사용법:
+    pytest -n 4 --duration-schedule
+
+설정 (pytest.ini):
+    duration_schedule_groups =
+        tests/integration
+        tests/e2e
+"""
+
+from __future__ import annotations
+
+import heapq
+import statistics
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable
+
+import pytest
+from xdist.scheduler import LoadScopeScheduling
+
+from plugins.timing import PHASES, history_path, load_history, median_duration
+
+# history가 전혀 없을 때 사용할 테스트당 예상 시간 (초)
+DEFAULT_ESTIMATE_SECONDS = 1.0
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("xdist")
+    group.addoption(
+        "--duration-schedule",
+        action="store_true",
+        default=False,
+        help="history의 테스트 실행 시간을 기준으로 긴 작업부터 워커에 배정 (-n 과 함께 사용)",
+    )
+    parser.addini(
+        "duration_schedule_groups",
+        "같은 워커에서 함께 실행할 nodeid 접두사 (세션 픽스처 공유 그룹)",
+        type="linelist",
+        default=["tests/integration", "tests/e2e"],
+    )
+
+
+def pytest_configure(config):
+    # 스케줄링은 controller에서만 수행
+    if config.getoption("--duration-schedule") and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(DurationSchedulePlugin(config), "duration_schedule")
+
+
+def simulate_makespan(durations: list[float], workers: int) -> list[float]:
+    """주어진 순서대로 가장 먼저 비는 워커에 배정했을 때 워커별 총 시간"""
+    loads = [0.0] * max(workers, 1)
+    heapq.heapify(loads)
+    for duration in durations:
+        heapq.heappush(loads, heapq.heappop(loads) + duration)
+    return sorted(loads, reverse=True)
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """
+    LoadScopeScheduling과 같은 방식으로 작업 단위를 배정하되,
+    작업 단위를 그룹 접두사로 묶고 예상 시간이 긴 순서로 workqueue를 정렬한다.
+    그룹에 속하지 않는 테스트는 테스트 하나가 하나의 작업 단위가 된다.
+    """
+
+    # LoadScopeScheduling.__init__에서 설정되는 속성 (mypy가 타입을 추론하지 못함)
+    workqueue: OrderedDict[str, dict[str, bool]]
+    collection: list[str] | None
+
+    def __init__(
+        self,
+        config: pytest.Config,
+        log=None,
+        estimate: Callable[[str], float] | None = None,
+        groups: list[str] | None = None,
+    ):
+        super().__init__(config, log)
+        self.estimate = estimate or (lambda nodeid: DEFAULT_ESTIMATE_SECONDS)
+        self.groups = [group.rstrip("/") for group in groups or []]
+        self.unit_estimates: dict[str, float] = {}
+        # 첫 배정 시각 (워커 기동/수집 시간을 제외한 실행 구간의 시작)
+        self.started_at: float | None = None
+
+    def _split_scope(self, nodeid: str) -> str:
+        for group in self.groups:
+            if nodeid.startswith(group + "/") or nodeid.startswith(group + "::"):
+                return group
+        return nodeid
+
+    def _reschedule(self, node) -> None:
+        """실행 중인 테스트 하나만 남았을 때 다음 작업 단위를 배정 (긴 작업 선점 방지)"""
+        if node.shutting_down:
+            return
+        if not self.workqueue:
+            node.shutdown()
+            return
+        if self._pending_of(self.assigned_work[node]) > 1:
+            return
+        self._assign_work_unit(node)
+
+    def schedule(self) -> None:
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            for node in self.nodes:
+                self._reschedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = list(next(iter(self.registered_collections.values())))
+        if not self.collection:
+            return
+        self.started_at = time.perf_counter()
+
+        units: dict[str, dict[str, bool]] = {}
+        for nodeid in self.collection:
+            scope = self._split_scope(nodeid)
+            units.setdefault(scope, {})[nodeid] = False
+            self.unit_estimates[scope] = self.unit_estimates.get(scope, 0.0) + self.estimate(nodeid)
+
+        self.workqueue = OrderedDict(
+            sorted(units.items(), key=lambda item: self.unit_estimates[item[0]], reverse=True)
+        )
+
+        extra_nodes = len(self.nodes) - len(self.workqueue)
+        for _ in range(max(extra_nodes, 0)):
+            unused_node, _assigned = self.assigned_work.popitem()
+            self.log(f"Shutting down unused node {unused_node}")
+            unused_node.shutdown()
+
+        for node in self.nodes:
+            self._assign_work_unit(node)
+        for node in self.nodes:
+            self._reschedule(node)
+
+        if not self.workqueue:
+            for node in self.nodes:
+                node.shutdown()
+
+
+class DurationSchedulePlugin:
+    """DurationScheduling 생성, 워커 사용률 집계 및 리포트"""
+
+    def __init__(self, config: pytest.Config):
+        self.config = config
+        self.history = load_history(history_path(config))
+        self.groups = config.getini("duration_schedule_groups")
+        self.scheduler: DurationScheduling | None = None
+
+        known = [
+            sum(median_duration(self.history, nodeid, phase) or 0.0 for phase in PHASES)
+            for nodeid in self.history["tests"]
+        ]
+        self.default_estimate = statistics.median(known) if known else DEFAULT_ESTIMATE_SECONDS
+
+        self.busy: dict[str, float] = defaultdict(float)
+        self.test_counts: dict[str, int] = defaultdict(int)
+
+    def estimate(self, nodeid: str) -> float:
+        """setup + call + teardown 중앙값 합 (history가 없으면 전체 중앙값)"""
+        if nodeid not in self.history["tests"]:
+            return self.default_estimate
+        return sum(median_duration(self.history, nodeid, phase) or 0.0 for phase in PHASES)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        self.scheduler = DurationScheduling(config, log, estimate=self.estimate, groups=self.groups)
+        return self.scheduler
+
+    def pytest_runtest_logreport(self, report):
+        node = getattr(report, "node", None)
+        worker = getattr(getattr(node, "gateway", None), "id", None)
+        if worker is None:
+            return
+        self.busy[worker] += report.duration
+        if report.when == "call":
+            self.test_counts[worker] += 1
+
+    def pytest_terminal_summary(self, terminalreporter):
+        scheduler = self.scheduler
+        if scheduler is None or not scheduler.collection:
+            return
+        write = terminalreporter.write_line
+        wall = time.perf_counter() - (scheduler.started_at or time.perf_counter())
+        workers = sorted(self.busy) or [node.gateway.id for node in scheduler.nodes]
+
+        terminalreporter.section("duration-aware scheduling")
+        for worker in workers:
+            busy = self.busy.get(worker, 0.0)
+            utilization = busy / wall * 100 if wall else 0.0
+            write(
+                f"  {worker}: busy {busy:8.2f}s / wall {wall:8.2f}s "
+                f"({utilization:5.1f}%)  tests {self.test_counts.get(worker, 0)}"
+            )
+        if workers:
+            mean_utilization = sum(self.busy.values()) / (wall * len(workers)) * 100 if wall else 0
+            write(f"  mean utilization: {mean_utilization:.1f}%")
+
+        # 수집 순서대로 테스트 단위 배정(기본 --dist load 근사) 대비 예상 makespan 비교
+        worker_count = max(len(workers), 1)
+        baseline = simulate_makespan(
+            [self.estimate(nodeid) for nodeid in scheduler.collection], worker_count
+        )[0]
+        planned = simulate_makespan(
+            sorted(scheduler.unit_estimates.values(), reverse=True), worker_count
+        )[0]
+        saved = baseline - planned
+        ratio = saved / baseline * 100 if baseline else 0.0
+        write(
+            f"  predicted makespan: collection order {baseline:.2f}s -> "
+            f"longest-first {planned:.2f}s (saved {saved:.2f}s, {ratio:.1f}%)"
+        )
+        write(f"  actual wall clock: {wall:.2f}s")
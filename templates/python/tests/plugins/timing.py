@@ -0,0 +1,321 @@
+"""
+테스트/픽스처 실행 시간 기록 플러그인
+
+- 모든 테스트의 setup/call/teardown 시간과 픽스처별 setup/teardown 시간을 기록
+  (setup_logging, database_connection, app_server 같은 세션 픽스처 포함)
+- 최근 N회 실행 기록을 history 파일(.pytest-timings.json)에 누적
+- 이전 실행 중앙값 대비 크게 느려진 테스트를 regression으로 표시
+- 측정된 call 시간이 임계값(기본 10초) 이상인 테스트에 slow 마커를 자동 적용하여
+  `pytest -m "not slow"`가 항상 실제 측정값을 따르도록 함
+- 세션 종료 시 slow 마커 추가/해제 제안과 느린 픽스처 목록을 출력
+
+pytest-xdist 사용 시 테스트 시간은 controller가 수집하고,
+픽스처 시간은 워커의 workeroutput으로 전달받아 controller만 history를 기록한다.
+
+설정 (pytest.ini - pyproject.toml [tool.pytest.ini_options]에도 같은 값 유지):
+    timing_history = ".pytest-timings.json"
+    timing_slow_threshold = "10"
+    timing_auto_slow = true
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+HISTORY_VERSION = 1
+PHASES = ("setup", "call", "teardown")
+
+# regression 판정 시 무시할 최소 증가량 (초) - 아주 빠른 테스트의 노이즈 제외
+REGRESSION_MIN_SECONDS = 0.05
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("timing", "테스트 실행 시간 기록")
+    group.addoption(
+        "--timing-history",
+        action="store",
+        default=None,
+        help="실행 시간 history 파일 경로 (기본값: ini timing_history)",
+    )
+    group.addoption(
+        "--no-timing-history",
+        action="store_true",
+        default=False,
+        help="이번 실행 결과를 history에 기록하지 않음",
+    )
+    parser.addini(
+        "timing_history",
+        "실행 시간 history 파일 경로 (rootdir 기준)",
+        default=".pytest-timings.json",
+    )
+    parser.addini(
+        "timing_slow_threshold",
+        "slow 마커를 적용할 call 시간 임계값 (초)",
+        default="10",
+    )
+    parser.addini(
+        "timing_auto_slow",
+        "history 기반으로 slow 마커를 자동 적용",
+        type="bool",
+        default=True,
+    )
+    parser.addini(
+        "timing_history_size",
+        "테스트/픽스처별로 보관할 최근 실행 기록 수",
+        default="20",
+    )
+    parser.addini(
+        "timing_regression_factor",
+        "이전 중앙값 대비 몇 배 이상 느려지면 regression으로 표시할지",
+        default="2.0",
+    )
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(TimingRecorder(config), "timing_recorder")
+
+
+def disable_history(config: pytest.Config) -> None:
+    """이번 실행 결과를 history에 기록하지 않음 (실행 시간을 왜곡하는 측정 플러그인에서 호출)"""
+    config.option.no_timing_history = True
+
+
+def history_path(config: pytest.Config) -> Path:
+    path = Path(config.getoption("--timing-history") or config.getini("timing_history"))
+    if not path.is_absolute():
+        path = Path(config.rootpath) / path
+    return path
+
+
+def load_history(path: Path) -> dict[str, Any]:
+    """history 파일 로드 (없거나 형식이 다르면 빈 history)"""
+    empty: dict[str, Any] = {"version": HISTORY_VERSION, "tests": {}, "fixtures": {}}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return empty
+    if not isinstance(data, dict) or data.get("version") != HISTORY_VERSION:
+        return empty
+    data.setdefault("tests", {})
+    data.setdefault("fixtures", {})
+    return data
+
+
+def save_history(path: Path, history: dict[str, Any]) -> None:
+    """임시 파일에 쓴 뒤 교체하여 중단 시에도 history가 깨지지 않도록 함"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(history, indent=1, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def median_duration(history: dict[str, Any], nodeid: str, phase: str = "call") -> float | None:
+    """테스트 phase별 최근 기록의 중앙값 (기록이 없으면 None)"""
+    samples = history.get("tests", {}).get(nodeid, {}).get(phase)
+    if not samples:
+        return None
+    return float(statistics.median(samples))
+
+
+def _append(samples: list[float], value: float, size: int) -> list[float]:
+    samples.append(round(value, 6))
+    return samples[-size:]
+
+
+def fixture_key(fixturedef: pytest.FixtureDef) -> str:
+    """픽스처 이름 + 정의 위치 (같은 이름의 override 구분)"""
+    baseid = fixturedef.baseid or "<plugin>"
+    return f"{baseid}::{fixturedef.argname}"
+
+
+class TimingRecorder:
+    """테스트/픽스처 시간 측정, history 기록, slow 마커 관리"""
+
+    def __init__(self, config: pytest.Config):
+        self.config = config
+        self.path = history_path(config)
+        self.history = load_history(self.path)
+        self.slow_threshold = float(config.getini("timing_slow_threshold"))
+        self.auto_slow = config.getini("timing_auto_slow")
+        self.history_size = int(config.getini("timing_history_size"))
+        self.regression_factor = float(config.getini("timing_regression_factor"))
+        self.is_worker = hasattr(config, "workerinput")
+
+        # 이번 실행 측정값
+        self.test_durations: dict[str, dict[str, float]] = defaultdict(dict)
+        # fixture key -> {"scope", "setup": [..], "teardown": [..]}
+        self.fixture_durations: dict[str, dict[str, Any]] = {}
+        self._teardown_started: dict[str, float] = {}
+        # 이번 실행 기록 전의 call 시간 중앙값 (regression 비교 기준)
+        self.previous: dict[str, float | None] = {}
+
+        self.auto_marked: set[str] = set()
+        self.manually_marked: set[str] = set()
+
+    # --- slow 마커 자동 적용 ---
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self, config, items):
+        """-m 필터링(deselect)보다 먼저 실행되어야 자동 slow 마커가 반영됨"""
+        for item in items:
+            if item.get_closest_marker("slow") is not None:
+                self.manually_marked.add(item.nodeid)
+                continue
+            if not self.auto_slow:
+                continue
+            median = median_duration(self.history, item.nodeid)
+            if median is not None and median >= self.slow_threshold:
+                item.add_marker(pytest.mark.slow)
+                self.auto_marked.add(item.nodeid)
+
+    # --- 테스트 phase 시간 ---
+
+    def pytest_runtest_logreport(self, report):
+        if report.when in PHASES:
+            self.test_durations[report.nodeid][report.when] = report.duration
+
+    # --- 픽스처 시간 ---
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        key = fixture_key(fixturedef)
+        started = time.perf_counter()
+        yield
+        duration = time.perf_counter() - started
+
+        record = self.fixture_durations.setdefault(
+            key, {"scope": fixturedef.scope, "setup": [], "teardown": []}
+        )
+        record["setup"].append(duration)
+        # 나중에 등록된 finalizer가 먼저 실행되므로(LIFO) 픽스처 자체 teardown 직전에 호출됨
+        fixturedef.addfinalizer(
+            lambda: self._teardown_started.__setitem__(key, time.perf_counter())
+        )
+
+    def pytest_fixture_post_finalizer(self, fixturedef, request):
+        key = fixture_key(fixturedef)
+        started = self._teardown_started.pop(key, None)
+        if started is not None and key in self.fixture_durations:
+            self.fixture_durations[key]["teardown"].append(time.perf_counter() - started)
+
+    # --- xdist: 워커 픽스처 시간을 controller로 전달 ---
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        worker_fixtures = getattr(node, "workeroutput", {}).get("timing_fixtures", {})
+        for key, record in worker_fixtures.items():
+            merged = self.fixture_durations.setdefault(
+                key, {"scope": record["scope"], "setup": [], "teardown": []}
+            )
+            merged["setup"].extend(record["setup"])
+            merged["teardown"].extend(record["teardown"])
+
+    # --- history 기록 ---
+
+    def pytest_sessionfinish(self, session):
+        if self.is_worker:
+            self.config.workeroutput["timing_fixtures"] = self.fixture_durations  # type: ignore[attr-defined]
+            return
+        self.previous = {
+            nodeid: median_duration(self.history, nodeid) for nodeid in self.test_durations
+        }
+        if self.config.getoption("--no-timing-history") or not self.test_durations:
+            return
+
+        tests = self.history["tests"]
+        for nodeid, phases in self.test_durations.items():
+            entry = tests.setdefault(nodeid, {})
+            for phase, duration in phases.items():
+                entry[phase] = _append(entry.get(phase, []), duration, self.history_size)
+
+        fixtures = self.history["fixtures"]
+        for key, record in self.fixture_durations.items():
+            entry = fixtures.setdefault(key, {})
+            entry["scope"] = record["scope"]
+            for phase in ("setup", "teardown"):
+                if record[phase]:
+                    mean = statistics.fmean(record[phase])
+                    entry[phase] = _append(entry.get(phase, []), mean, self.history_size)
+
+        self.history["updated_at"] = time.time()
+        save_history(self.path, self.history)
+
+    # --- 요약 출력 ---
+
+    def regressions(self) -> list[tuple[str, float, float]]:
+        """(nodeid, 이전 중앙값, 이번 call 시간) - 이전 중앙값 대비 factor배 이상 느려진 테스트"""
+        found = []
+        for nodeid, phases in self.test_durations.items():
+            previous = self.previous.get(nodeid)
+            current = phases.get("call")
+            if previous is None or current is None:
+                continue
+            if current >= previous * self.regression_factor and (
+                current - previous >= REGRESSION_MIN_SECONDS
+            ):
+                found.append((nodeid, previous, current))
+        return sorted(found, key=lambda row: row[2] - row[1], reverse=True)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.is_worker or not self.test_durations:
+            return
+        write = terminalreporter.write_line
+
+        measured_slow = {
+            nodeid
+            for nodeid, phases in self.test_durations.items()
+            if phases.get("call", 0.0) >= self.slow_threshold
+        }
+        suggest_add = sorted(measured_slow - self.manually_marked - self.auto_marked)
+        suggest_remove = sorted(
+            nodeid
+            for nodeid in self.manually_marked
+            if nodeid in self.test_durations and nodeid not in measured_slow
+        )
+        regressions = self.regressions()
+
+        if not (
+            self.auto_marked
+            or suggest_add
+            or suggest_remove
+            or regressions
+            or self.fixture_durations
+        ):
+            return
+        terminalreporter.section("test timings")
+        if self.auto_marked:
+            write(
+                f"auto slow marker (history >= {self.slow_threshold:g}s): {len(self.auto_marked)} test(s)"
+            )
+        if suggest_add:
+            write(f"slow 마커 추가 제안 (call >= {self.slow_threshold:g}s):")
+            for nodeid in suggest_add:
+                write(f"  {self.test_durations[nodeid]['call']:8.2f}s  {nodeid}")
+        if suggest_remove:
+            write(f"slow 마커 해제 제안 (call < {self.slow_threshold:g}s):")
+            for nodeid in suggest_remove:
+                write(f"  {self.test_durations[nodeid].get('call', 0.0):8.2f}s  {nodeid}")
+        if regressions:
+            write(f"regressions (>= {self.regression_factor:g}x previous median):")
+            for nodeid, previous, current in regressions:
+                write(f"  {previous:8.2f}s -> {current:8.2f}s  {nodeid}")
+
+        slowest = sorted(
+            self.fixture_durations.items(),
+            key=lambda kv: sum(kv[1]["setup"]) + sum(kv[1]["teardown"]),
+            reverse=True,
+        )[:10]
+        if slowest:
+            write("slowest fixtures (setup + teardown, total):")
+            for key, record in slowest:
+                total = sum(record["setup"]) + sum(record["teardown"])
+                name = key.rsplit("::", 1)[-1]
+                write(f"  {total:8.2f}s  {name} [{record['scope']}] x{len(record['setup'])}")
@@ -0,0 +1,111 @@
+"""
+import 시간 예산 검사
+
+`python -X importtime -c "import myproject"`를 실행하여
+- myproject import 누적 시간이 예산을 넘지 않는지
+- myproject가 import 시점에 허용되지 않은 서드파티 모듈을 불러오지 않는지
+검사합니다. 공개 API는 src/myproject/__init__.py의 _LAZY_EXPORTS로 지연 로딩하세요.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# import 누적 시간 예산 (ms) - 느린 CI 머신에서는 환경 변수로 조정
+IMPORT_BUDGET_MS = float(os.getenv("MYPROJECT_IMPORT_BUDGET_MS", "100"))
+
+# import myproject 시점에 함께 로드되어도 되는 서드파티 최상위 모듈
+ALLOWED_THIRD_PARTY: frozenset[str] = frozenset()
+
+# 노이즈를 줄이기 위해 여러 번 측정하여 가장 빠른 값을 사용
+MEASURE_ROUNDS = 3
+
+SRC_DIR = Path(__file__).resolve().parents[3] / "src"
+
+
+def _run_importtime(module: str) -> tuple[list[tuple[int, int, str]], set[str]]:
+    """
+    -X importtime 출력 파싱
+
+    (누적 시간 us, 중첩 깊이, 모듈 이름) 목록(완료 순서)과 실제로 로드된 모듈 이름을 반환.
+    실패한 선택적 import도 importtime에 출력되므로 sys.modules로 걸러낸다.
+    """
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    code = f"import {module}, sys; print('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    loaded = set(result.stdout.split())
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        entries.append((int(cumulative_us), depth, name.strip()))
+    return entries, loaded
+
+
+def _measure(module: str) -> tuple[float, set[str]]:
+    """module의 누적 import 시간(ms)과 module이 불러온 하위 모듈 이름"""
+    entries, loaded = _run_importtime(module)
+    index = max(i for i, (_, depth, name) in enumerate(entries) if name == module and depth == 0)
+    # 하위 import는 상위 모듈보다 먼저 완료되어 바로 앞에 더 깊은 depth로 출력됨
+    children = set()
+    for _cumulative, depth, name in reversed(entries[:index]):
+        if depth == 0:
+            break
+        if name in loaded:
+            children.add(name)
+    return entries[index][0] / 1000, children
+
+
+def _third_party(modules: set[str], package: str) -> set[str]:
+    top_level = {name.split(".", 1)[0] for name in modules}
+    return {
+        name
+        for name in top_level
+        if name != package and name not in sys.stdlib_module_names and not name.startswith("_")
+    }
+
+
+@pytest.fixture(scope="module")
+def import_profile():
+    runs = [_measure("myproject") for _ in range(MEASURE_ROUNDS)]
+    best_ms = min(elapsed for elapsed, _ in runs)
+    modules = set().union(*(children for _, children in runs))
+    return best_ms, modules
+
+
+def test_import_time_within_budget(import_profile):
+    elapsed_ms, _modules = import_profile
+    assert elapsed_ms <= IMPORT_BUDGET_MS, (
+        f"import myproject took {elapsed_ms:.1f}ms (budget {IMPORT_BUDGET_MS:.0f}ms); "
+        "move heavy imports behind _LAZY_EXPORTS"
+    )
+
+
+def test_import_does_not_load_heavy_third_party_modules(import_profile):
+    _elapsed_ms, modules = import_profile
+    unexpected = _third_party(modules, "myproject") - ALLOWED_THIRD_PARTY
+    assert not unexpected, (
+        f"import myproject eagerly loads third-party modules: {sorted(unexpected)}; "
+        "move them behind _LAZY_EXPORTS or add them to ALLOWED_THIRD_PARTY"
+    )
+
+
+def test_lazy_exports_resolve():
+    import myproject
+
+    for name in myproject._LAZY_EXPORTS:
+        assert getattr(myproject, name) is not None
+    with pytest.raises(AttributeError):
+        _ = myproject.does_not_exist
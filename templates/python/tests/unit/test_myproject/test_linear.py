@@ -0,0 +1,239 @@
+"""
+myproject.linear 단위 테스트
+
+httpx.MockTransport로 만든 Linear GraphQL stub으로 batch, 페이지네이션, rate limit 처리를 검사합니다.
+"""
+
+import json
+import re
+from typing import Any
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from myproject.linear import LinearAPIError, LinearClient, Selection, TokenBucket, build_batch
+
+ISSUES = [
+    {"id": f"issue-{n}", "identifier": f"ENG-{n}", "title": f"Issue {n}"} for n in range(1, 121)
+]
+
+_FIELD_RE = re.compile(r"^\s*(b\d+): (\w+)", re.MULTILINE)
+
+
+class LinearStub:
+    """issues 페이지네이션, issue/documentCreate batch를 흉내 내는 GraphQL stub"""
+
+    def __init__(self):
+        self.requests = []
+        self.responses: list[
+            httpx.Response
+        ] = []  # 미리 지정한 응답 (rate limit 등) - 비어 있으면 정상 처리
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.requests.append(body)
+        if self.responses:
+            return self.responses.pop(0)
+        query, variables = body["query"], body["variables"]
+        headers = {"X-RateLimit-Requests-Remaining": "1000"}
+
+        if "issues(" in query:
+            start = int(variables["after"] or 0)
+            end = start + variables["first"]
+            page = {
+                "nodes": ISSUES[start:end],
+                "pageInfo": {"hasNextPage": end < len(ISSUES), "endCursor": str(end)},
+            }
+            return httpx.Response(200, json={"data": {"issues": page}}, headers=headers)
+
+        data: dict[str, Any] = {}
+        errors: list[dict[str, Any]] = []
+        for alias, name in _FIELD_RE.findall(query):
+            if name == "issue":
+                issue_id = variables[f"{alias}_id"]
+                match = [issue for issue in ISSUES if issue["identifier"] == issue_id]
+                data[alias] = match[0] if match else None
+                if not match:
+                    errors.append({"message": "Entity not found", "path": [alias]})
+            elif name == "documentCreate":
+                document = {"id": f"doc-{alias}", "title": variables[f"{alias}_input"]["title"]}
+                data[alias] = {"success": True, "document": document}
+        payload = {"data": data, **({"errors": errors} if errors else {})}
+        return httpx.Response(200, json=payload, headers=headers)
+
+
+@pytest.fixture
+def stub():
+    return LinearStub()
+
+
+@pytest_asyncio.fixture
+async def client(stub):
+    async with LinearClient("lin_api_test", transport=httpx.MockTransport(stub)) as client:
+        yield client
+
+
+def test_build_batch_aliases_fields_and_variables():
+    query, variables = build_batch(
+        "query",
+        [
+            Selection("issue(id: $id) { id }", {"id": ("String!", "ENG-1")}),
+            Selection("issue(id: $id) { id }", {"id": ("String!", "ENG-2")}),
+        ],
+    )
+
+    assert query.startswith("query Batch($b0_id: String!, $b1_id: String!)")
+    assert "b0: issue(id: $b0_id) { id }" in query
+    assert "b1: issue(id: $b1_id) { id }" in query
+    assert variables == {"b0_id": "ENG-1", "b1_id": "ENG-2"}
+    with pytest.raises(ValueError, match="undeclared variable"):
+        build_batch("query", [Selection("issue(id: $id) { id }")])
+
+
+@pytest.mark.asyncio
+async def test_batch_sends_one_request_per_chunk(stub, client):
+    client.max_batch_size = 20
+    ids = [f"ENG-{n}" for n in range(1, 46)]
+
+    issues = await client.get_issues(ids)
+
+    assert [issue["identifier"] for issue in issues] == ids
+    assert len(stub.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_partial_errors(client):
+    results = await client.batch(
+        [
+            Selection("issue(id: $id) { id }", {"id": ("String!", "ENG-1")}),
+            Selection("issue(id: $id) { id }", {"id": ("String!", "MISSING-1")}),
+        ],
+        return_exceptions=True,
+    )
+
+    assert results[0]["identifier"] == "ENG-1"
+    assert isinstance(results[1], LinearAPIError)
+    with pytest.raises(LinearAPIError, match="Entity not found"):
+        await client.get_issues(["ENG-1", "MISSING-1"])
+
+
+@pytest.mark.asyncio
+async def test_paginate_streams_pages_until_limit(stub, client):
+    issues = [issue async for issue in client.iter_issues(page_size=50)]
+    assert [issue["id"] for issue in issues] == [issue["id"] for issue in ISSUES]
+    assert len(stub.requests) == 3
+
+    stub.requests.clear()
+    issues = await client.list_issues(limit=70)
+    assert len(issues) == 70
+    assert [request["variables"]["first"] for request in stub.requests] == [70]
+
+
+@pytest.mark.asyncio
+async def test_release_notes_flow_uses_two_round_trips(stub, client):
+    issues = await client.list_issues(limit=50)
+    documents = await client.create_documents(
+        [
+            {"title": f"Release Notes {issue['identifier']}", "content": issue["title"]}
+            for issue in issues[:10]
+        ]
+    )
+
+    assert len(documents) == 10
+    assert documents[0]["title"] == "Release Notes ENG-1"
+    assert len(stub.requests) == 2
+    assert stub.requests[1]["query"].startswith("mutation Batch(")
+
+
+class FakeClock:
+    """TokenBucket에 주입하는 시계 - sleep은 실제로 기다리지 않고 시간만 진행"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("retry_after", "expected_waits"), [("0", []), ("2", [2.0])])
+async def test_rate_limited_response_is_retried(stub, retry_after, expected_waits):
+    clock = FakeClock()
+    bucket = TokenBucket.per_hour(1500, clock=clock, sleep=clock.sleep)
+    stub.responses.append(
+        httpx.Response(
+            400,
+            json={
+                "errors": [
+                    {"message": "Rate limit exceeded", "extensions": {"code": "RATELIMITED"}}
+                ]
+            },
+            headers={"Retry-After": retry_after, "X-RateLimit-Requests-Remaining": "0"},
+        )
+    )
+
+    async with LinearClient(
+        "lin_api_test", rate_limiter=bucket, transport=httpx.MockTransport(stub)
+    ) as client:
+        issues = await client.get_issues(["ENG-1"])
+
+    assert issues[0]["identifier"] == "ENG-1"
+    assert len(stub.requests) == 2
+    # Retry-After만큼 한 번만 기다림 (토큰 소진 후 refill 대기가 겹치지 않음)
+    assert clock.slept == pytest.approx(expected_waits)
+
+
+@pytest.mark.asyncio
+async def test_gateway_error_retries_queries_only(stub, client):
+    stub.responses.append(httpx.Response(503, headers={"Retry-After": "0"}))
+    issues = await client.get_issues(["ENG-1"])
+    assert issues[0]["identifier"] == "ENG-1"
+    assert len(stub.requests) == 2
+
+    # 뮤테이션은 서버에서 이미 반영됐을 수 있으므로 재시도하지 않음 (중복 생성 방지)
+    stub.responses.append(httpx.Response(504, headers={"Retry-After": "0"}))
+    with pytest.raises(LinearAPIError) as excinfo:
+        await client.create_document(title="Release Notes", content="-")
+    assert excinfo.value.status_code == 504
+    assert len(stub.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_http_error_raises(stub, client):
+    stub.responses.append(
+        httpx.Response(401, json={"errors": [{"message": "Authentication required"}]})
+    )
+
+    with pytest.raises(LinearAPIError) as excinfo:
+        await client.execute("query { viewer { id } }")
+    assert excinfo.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_for_refill():
+    now = [0.0]
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=lambda: now[0], sleep=fake_sleep)
+    for _ in range(4):
+        await bucket.acquire()
+
+    assert slept == [0.5, 0.5]
+    bucket.sync(0)
+    assert bucket.available == 0
+
+
+def test_missing_api_key(monkeypatch):
+    monkeypatch.delenv("LINEAR_API_KEY", raising=False)
+    with pytest.raises(ValueError, match="LINEAR_API_KEY"):
+        LinearClient()
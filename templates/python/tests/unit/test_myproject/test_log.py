@@ -0,0 +1,188 @@
+"""
+myproject.log 단위 테스트
+
+큐 기반 로깅의 JSON lines 형식, batch 기록, 로그 파일 병합을 검사합니다.
+"""
+
+import io
+import json
+import logging
+import queue
+import sys
+from datetime import date
+from logging.handlers import QueueHandler
+
+import pytest
+
+from myproject.log import (
+    BatchingQueueListener,
+    JSONFormatter,
+    configure_logging,
+    merge_log_files,
+    shutdown_logging,
+)
+
+
+class CountingStream(io.StringIO):
+    """write 호출 횟수를 세는 스트림"""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+@pytest.fixture
+def logger():
+    logger = logging.getLogger("tests.myproject.log")
+    logger.propagate = False
+    yield logger
+    shutdown_logging(logger)
+    logger.propagate = True
+
+
+def _read_lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_json_formatter_includes_extra_and_exception():
+    formatter = JSONFormatter(static_fields={"worker": "gw0"})
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.makeLogRecord(
+            {
+                "name": "app",
+                "levelno": logging.ERROR,
+                "levelname": "ERROR",
+                "msg": "failed %s",
+                "args": ("job",),
+                "exc_info": sys.exc_info(),
+                "request_id": "r-1",
+            }
+        )
+
+    entry = json.loads(formatter.format(record))
+
+    assert entry["message"] == "failed job"
+    assert entry["level"] == "ERROR"
+    assert entry["worker"] == "gw0"
+    assert entry["request_id"] == "r-1"
+    assert "ValueError: boom" in entry["exc_info"]
+
+
+def test_listener_writes_queued_records_in_one_batch():
+    stream = CountingStream()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log_queue: queue.SimpleQueue[logging.LogRecord | None] = queue.SimpleQueue()
+    for index in range(100):
+        log_queue.put(logging.makeLogRecord({"msg": f"line {index}", "levelno": logging.INFO}))
+
+    listener = BatchingQueueListener(log_queue, handler, batch_size=512)
+    listener.start()
+    listener.stop()
+
+    assert stream.getvalue().splitlines() == [f"line {index}" for index in range(100)]
+    assert stream.writes == 1
+
+
+def test_configure_logging_writes_json_lines(tmp_path, logger):
+    log_file = tmp_path / "app.jsonl"
+    configure_logging(
+        level="INFO",
+        log_file=log_file,
+        console=False,
+        static_fields={"app": "demo"},
+        logger=logger,
+    )
+    items = ["a"]
+
+    logger.debug("hidden")
+    logger.info("items=%s", items, extra={"user_id": 7})
+    # 메시지는 로그 호출 시점 값으로 기록됨
+    items.append("b")
+    shutdown_logging(logger)
+
+    (entry,) = _read_lines(log_file)
+    assert entry["message"] == "items=['a']"
+    assert entry["user_id"] == 7
+    assert entry["app"] == "demo"
+    assert not any(isinstance(handler, QueueHandler) for handler in logger.handlers)
+
+
+def test_configure_logging_snapshots_extra_fields(tmp_path, logger):
+    log_file = tmp_path / "app.jsonl"
+    configure_logging(log_file=log_file, console=False, logger=logger)
+    steps = ["fetch"]
+    state = {"status": "running", "steps": steps}
+
+    logger.info("job", extra={"state": state, "attempt": 1})
+    # listener 스레드가 기록하기 전에 바뀌어도 로그에는 호출 시점 값이 남아야 함
+    state["status"] = "done"
+    steps.append("publish")
+    shutdown_logging(logger)
+
+    (entry,) = _read_lines(log_file)
+    assert entry["state"] == {"status": "running", "steps": ["fetch"]}
+    assert entry["attempt"] == 1
+
+
+def test_queue_handler_leaves_caller_record_unchanged(tmp_path, caplog):
+    logger = logging.getLogger("tests.myproject.log.caplog")
+    log_file = tmp_path / "app.jsonl"
+    configure_logging(log_file=log_file, console=False, logger=logger)
+    when = date(2026, 1, 1)
+    ids = (1, 2)
+
+    try:
+        logger.warning("user %s", "bob", extra={"when": when, "ids": ids})
+    finally:
+        shutdown_logging(logger)
+
+    # queue handler 다음에 전파된 caplog handler는 원래 레코드를 봐야 함
+    (record,) = [record for record in caplog.records if record.name == logger.name]
+    assert record.msg == "user %s"
+    assert record.args == ("bob",)
+    assert record.when is when
+    assert record.ids is ids
+    (entry,) = _read_lines(log_file)
+    assert entry["message"] == "user bob"
+    assert entry["when"] == "2026-01-01"
+    assert entry["ids"] == [1, 2]
+
+
+def test_configure_logging_replaces_previous_setup(tmp_path, logger):
+    first = configure_logging(log_file=tmp_path / "first.jsonl", console=False, logger=logger)
+    logger.info("one")
+    second = configure_logging(log_file=tmp_path / "second.jsonl", console=False, logger=logger)
+    logger.info("two")
+    assert second.flush(timeout=5)
+
+    assert sum(isinstance(handler, QueueHandler) for handler in logger.handlers) == 1
+    assert first.flush() is True  # 이미 종료된 listener
+    assert [entry["message"] for entry in _read_lines(tmp_path / "first.jsonl")] == ["one"]
+    assert [entry["message"] for entry in _read_lines(tmp_path / "second.jsonl")] == ["two"]
+
+
+def test_merge_log_files_orders_by_created(tmp_path):
+    worker_a = tmp_path / "pytest-gw0.jsonl"
+    worker_b = tmp_path / "pytest-gw1.jsonl"
+    worker_a.write_text(
+        "\n".join(json.dumps({"created": t, "message": f"a{t}"}) for t in (1.0, 3.0, 5.0)) + "\n",
+        encoding="utf-8",
+    )
+    worker_b.write_text(
+        "\n".join(json.dumps({"created": t, "message": f"b{t}"}) for t in (2.0, 4.0)) + "\n",
+        encoding="utf-8",
+    )
+
+    count = merge_log_files([worker_a, worker_b], tmp_path / "pytest.jsonl", remove_sources=True)
+
+    assert count == 5
+    merged = [entry["message"] for entry in _read_lines(tmp_path / "pytest.jsonl")]
+    assert merged == ["a1.0", "b2.0", "a3.0", "b4.0", "a5.0"]
+    assert not worker_a.exists() and not worker_b.exists()
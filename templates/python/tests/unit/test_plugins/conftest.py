@@ -0,0 +1,30 @@
+"""
+플러그인 테스트 설정
+- pytester로 tests/plugins의 플러그인을 등록한 별도 pytest 세션 실행 (xdist 워커 프로세스 포함)
+"""
+
+from pathlib import Path
+
+import pytest
+
+# plugins 패키지가 있는 디렉토리 (tests/)
+TESTS_DIR = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture
+def use_plugins(pytester: pytest.Pytester):
+    """
+    pytester 세션에 plugins.* 등록
+
+    use_plugins("plugins.timing", timing_history="history.json")처럼 플러그인과 ini 값을 받아
+    pytester를 반환한다. xdist 워커는 controller의 sys.path를 쓰므로 ini pythonpath로 추가한다.
+    """
+
+    def setup(*plugins: str, **ini: str) -> pytest.Pytester:
+        lines = ["[pytest]", f"pythonpath = {TESTS_DIR}"]
+        lines += [f"{name} = {value}" for name, value in ini.items()]
+        pytester.makeini("\n".join(lines))
+        pytester.makeconftest(f"pytest_plugins = {list(plugins)!r}")
+        return pytester
+
+    return setup
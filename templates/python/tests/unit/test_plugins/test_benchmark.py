@@ -0,0 +1,126 @@
+"""
+plugins.benchmark 단위 테스트
+
+pytester로 benchmark 테스트 선택, baseline 선택 순서, --benchmark-compare, 성능 저하 판정을 검사합니다.
+"""
+
+import json
+import os
+
+import pytest
+from plugins.benchmark import RESULT_VERSION, summarize
+
+MACHINE = "test-machine"
+NODEID = "test_speed.py::test_fast"
+
+TESTS = """
+import pytest
+
+
+@pytest.mark.benchmark
+def test_fast(bench):
+    bench(sum, range(10))
+
+
+def test_regular():
+    assert True
+"""
+
+
+@pytest.fixture
+def bench_pytester(use_plugins):
+    pytester = use_plugins(
+        "plugins.benchmark",
+        markers="benchmark: 성능 벤치마크",
+        benchmark_warmup="0",
+        benchmark_rounds="2",
+        benchmark_min_time="0",
+    )
+    pytester.makepyfile(test_speed=TESTS)
+    return pytester
+
+
+def _write_baseline(path, commit, median=1.0, mtime=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": RESULT_VERSION,
+        "commit": commit,
+        "benchmarks": {NODEID: {"median": median}},
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def _run(pytester, *args):
+    return pytester.runpytest("--benchmark", f"--benchmark-machine={MACHINE}", *args)
+
+
+def test_summarize_single_round():
+    stats = summarize([0.25], number=4)
+
+    assert stats["rounds"] == 1
+    assert stats["number"] == 4
+    assert stats["min"] == stats["max"] == stats["median"] == stats["mean"] == 0.25
+    assert stats["stdev"] == 0.0
+    assert stats["iqr"] == 0.0
+
+
+def test_benchmarks_are_deselected_by_default(bench_pytester):
+    bench_pytester.runpytest().assert_outcomes(passed=1, deselected=1)
+    bench_pytester.runpytest("-m", "benchmark").assert_outcomes(passed=1, deselected=1)
+    _run(bench_pytester).assert_outcomes(passed=2)
+
+
+def test_baseline_candidate_order(bench_pytester):
+    storage = bench_pytester.path / ".benchmarks" / MACHINE
+    reference = bench_pytester.path / "tests" / "benchmarks" / "baselines" / f"{MACHINE}.json"
+    # pytester 디렉토리는 git 저장소가 아니므로 현재 커밋은 "unknown"
+    own = storage / "unknown.json"
+
+    result = _run(bench_pytester)
+    result.stdout.fnmatch_lines([f"machine: {MACHINE}  commit: unknown"])
+
+    # 커밋된 기준 baseline (CI, 새 머신)
+    _write_baseline(reference, "ref0001")
+    _run(bench_pytester).stdout.fnmatch_lines(["*(baseline: reference ref0001)"])
+
+    # 같은 커밋에서 다시 실행하면 현재 커밋의 로컬 baseline이 기준 baseline보다 우선
+    _write_baseline(own, "unknown", mtime=3000)
+    _run(bench_pytester).stdout.fnmatch_lines(["*(baseline: unknown)"])
+
+    # 다른 커밋의 로컬 baseline이 있으면 가장 최근 것 (현재 커밋 baseline이 더 최근이어도)
+    _write_baseline(storage / "abc1234.json", "abc1234", mtime=1000)
+    _write_baseline(storage / "def5678.json", "def5678", mtime=2000)
+    _run(bench_pytester).stdout.fnmatch_lines(["*(baseline: def5678)"])
+
+
+def test_compare_with_commit_or_json_path(bench_pytester):
+    storage = bench_pytester.path / ".benchmarks" / MACHINE
+    _write_baseline(storage / "abc1234.json", "abc1234", mtime=1000)
+    _write_baseline(storage / "def5678.json", "def5678", mtime=2000)
+    _write_baseline(bench_pytester.path / "saved" / "nightly.json", "nightly")
+
+    _run(bench_pytester, "--benchmark-compare=abc1234").stdout.fnmatch_lines(
+        ["*(baseline: abc1234)"]
+    )
+    _run(bench_pytester, "--benchmark-compare=saved/nightly.json").stdout.fnmatch_lines(
+        ["*(baseline: nightly)"]
+    )
+
+    result = _run(bench_pytester, "--benchmark-compare=0000000")
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+    result.stderr.fnmatch_lines(["*benchmark baseline not found:*0000000.json"])
+
+
+def test_regression_over_threshold_fails(bench_pytester):
+    _write_baseline(
+        bench_pytester.path / ".benchmarks" / MACHINE / "abc1234.json", "abc1234", 1e-12
+    )
+
+    result = _run(bench_pytester)
+
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(["*benchmark regression: median * at abc1234 (+*% > 10%)"])
+    # 허용 비율을 넘지 않으면 통과
+    _run(bench_pytester, "--benchmark-max-regression=1e15").assert_outcomes(passed=2)
@@ -0,0 +1,131 @@
+"""
+plugins.cassette_store 단위 테스트
+
+cassette 파일(JSON lines)과 인덱스 저장소 사이의 저장/재생, YAML fallback, 마이그레이션을 검사합니다.
+"""
+
+import json
+import os
+
+import pytest
+from plugins.cassette_store import (
+    STORE_FILENAME,
+    IndexedCassettePersister,
+    IndexedCassetteStore,
+    migrate_yaml_cassettes,
+)
+from vcr.persisters.filesystem import CassetteNotFoundError, FilesystemPersister
+from vcr.request import Request
+from vcr.serializers import yamlserializer
+
+BINARY_BODY = b"\x89PNG\r\n\x1a\n\xff\xfe"
+
+
+@pytest.fixture
+def library_dir(tmp_path):
+    return tmp_path / "cassettes"
+
+
+@pytest.fixture
+def persister(library_dir):
+    store = IndexedCassetteStore(library_dir / STORE_FILENAME)
+    yield IndexedCassettePersister(store, library_dir)
+    store.close()
+
+
+def _request(path="/items", body=None):
+    return Request("POST", f"https://api.example.com{path}", body, {"Authorization": "secret"})
+
+
+def _response(body):
+    return {
+        "status": {"code": 200, "message": "OK"},
+        "headers": {"Content-Type": ["application/octet-stream"]},
+        "body": {"string": body},
+    }
+
+
+def test_round_trip_writes_reviewable_jsonl(persister, library_dir):
+    cassette_path = library_dir / "api" / "test_download.yaml"
+
+    persister.save_cassette(
+        cassette_path,
+        {"requests": [_request(body="{}")], "responses": [_response(BINARY_BODY)]},
+        yamlserializer,
+    )
+    requests, responses = persister.load_cassette(cassette_path, yamlserializer)
+
+    (line,) = (library_dir / "api" / "test_download.jsonl").read_text(encoding="utf-8").splitlines()
+    assert "__b64__" in json.loads(line)["response"]["body"]["string"]
+    assert requests[0].uri == "https://api.example.com/items"
+    assert responses[0]["body"]["string"] == BINARY_BODY
+
+
+def test_edited_jsonl_is_reindexed(persister, library_dir):
+    cassette_path = library_dir / "test_items.yaml"
+    persister.save_cassette(
+        cassette_path,
+        {"requests": [_request()], "responses": [_response("before")]},
+        yamlserializer,
+    )
+    export_path = library_dir / "test_items.jsonl"
+    entry = json.loads(export_path.read_text(encoding="utf-8"))
+    entry["response"]["body"]["string"] = "after!"
+    export_path.write_text(json.dumps(entry) + "\n", encoding="utf-8")
+    # 같은 mtime 해상도 안에서 수정되어도 서명이 바뀌도록 mtime을 명시
+    stat = export_path.stat()
+    os.utime(export_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    _, responses = persister.load_cassette(cassette_path, yamlserializer)
+
+    assert responses[0]["body"]["string"] == b"after!"
+
+
+def test_missing_cassette_raises_not_found(persister, library_dir):
+    with pytest.raises(CassetteNotFoundError):
+        persister.load_cassette(library_dir / "test_missing.yaml", yamlserializer)
+
+
+def test_falls_back_to_yaml_cassette(persister, library_dir):
+    yaml_path = library_dir / "test_legacy.yaml"
+    FilesystemPersister.save_cassette(
+        yaml_path,
+        {"requests": [_request()], "responses": [_response(b"legacy")]},
+        yamlserializer,
+    )
+
+    requests, responses = persister.load_cassette(yaml_path, yamlserializer)
+
+    assert len(requests) == 1
+    assert responses[0]["body"]["string"] == b"legacy"
+    assert not persister.store.has("test_legacy")
+
+
+def test_migrate_applies_hooks_and_drops_filtered(persister, library_dir):
+    yaml_path = library_dir / "test_migrate.yaml"
+    FilesystemPersister.save_cassette(
+        yaml_path,
+        {
+            "requests": [_request("/keep"), _request("/drop")],
+            "responses": [_response(b"kept"), _response(b"dropped")],
+        },
+        yamlserializer,
+    )
+
+    def filter_request(request):
+        if request.path == "/drop":
+            return None
+        request.headers["Authorization"] = "[FILTERED]"
+        return request
+
+    count = migrate_yaml_cassettes(
+        library_dir, persister, before_record_request=filter_request, remove_yaml=True
+    )
+
+    assert count == 1
+    assert not yaml_path.exists()
+    requests, responses = persister.load_cassette(yaml_path, yamlserializer)
+    assert [request.path for request in requests] == ["/keep"]
+    assert requests[0].headers["Authorization"] == "[FILTERED]"
+    assert responses[0]["body"]["string"] == b"kept"
+    assert "secret" not in (library_dir / "test_migrate.jsonl").read_text(encoding="utf-8")
@@ -0,0 +1,98 @@
+"""
+plugins.impact 단위 테스트
+
+git diff 해석, 전체 실행 fallback 판정, 영향 테스트 선택을 검사합니다.
+"""
+
+from plugins.impact import IMPORT_TIME, affected_tests, full_run_trigger, parse_diff
+
+# git diff -U0 -M HEAD 출력 (바이너리 변경, 라인 수정/추가, 이름 변경, 삭제된 "-- " 라인)
+DIFF = """\
+diff --git a/tests/cassettes/store.bin b/tests/cassettes/store.bin
+index bdc955b..8835708 100644
+Binary files a/tests/cassettes/store.bin and b/tests/cassettes/store.bin differ
+diff --git a/src/app/core.py b/src/app/core.py
+index de98044..a7bc997 100644
+--- a/src/app/core.py
++++ b/src/app/core.py
+@@ -2 +2 @@ a
+-b
++B
+@@ -3,0 +4 @@ c
++d
+diff --git a/src/app/old.py b/src/app/new.py
+similarity index 100%
+rename from src/app/old.py
+rename to src/app/new.py
+diff --git a/src/app/schema.sql b/src/app/schema.sql
+index 33c719a..740c843 100644
+--- a/src/app/schema.sql
++++ b/src/app/schema.sql
+@@ -2 +1,0 @@ create
+--- comment
+diff --git a/src/app/added.py b/src/app/added.py
+new file mode 100644
+index 0000000..b0b2b1c
+--- /dev/null
++++ b/src/app/added.py
+@@ -0,0 +1 @@
++x = 1
+"""
+
+FULL_RUN_PATTERNS = ["conftest.py", "pyproject.toml", "tests/plugins/*"]
+
+
+def test_parse_diff():
+    changes = parse_diff(DIFF)
+
+    assert changes == {
+        "tests/cassettes/store.bin": None,
+        "src/app/core.py": {2, 3, 4},
+        "src/app/old.py": None,
+        "src/app/new.py": None,
+        "src/app/schema.sql": {2},
+        "src/app/added.py": None,
+    }
+
+
+def test_full_run_trigger():
+    assert full_run_trigger({"tests/unit/conftest.py": {3}}, FULL_RUN_PATTERNS) == (
+        "tests/unit/conftest.py"
+    )
+    assert full_run_trigger({"tests/plugins/timing.py": {1}}, FULL_RUN_PATTERNS) is not None
+    assert full_run_trigger({"src/app/core.py": {1}}, FULL_RUN_PATTERNS, ["tests"]) is None
+
+
+def test_full_run_trigger_on_test_data_files():
+    changes = parse_diff(DIFF)
+
+    assert full_run_trigger(changes, FULL_RUN_PATTERNS, ["tests"]) == "tests/cassettes/store.bin"
+    assert full_run_trigger({"tests/unit/test_core.py": {1}}, FULL_RUN_PATTERNS, ["tests"]) is None
+
+
+def _impact_map(dirty=False):
+    return {
+        "tests": ["test_a", "test_b", "test_c"],
+        "dirty": dirty,
+        "files": {
+            "src/app/core.py": {"1": [IMPORT_TIME], "5": [0], "9": [1]},
+            "src/app/util.py": {"3": [2]},
+        },
+    }
+
+
+def test_affected_tests_selects_tests_running_changed_lines():
+    assert affected_tests(_impact_map(), {"src/app/core.py": {5}}) == {"test_a"}
+    # 실행되지 않는 라인(주석 등)은 앞뒤의 실행 라인으로 판단
+    assert affected_tests(_impact_map(), {"src/app/core.py": {7}}) == {"test_a", "test_b"}
+    assert affected_tests(_impact_map(), {"src/app/other.py": {1}}) == set()
+
+
+def test_affected_tests_whole_file_changes():
+    every_core_test = {"test_a", "test_b"}
+
+    # import 시점에 실행된 라인 변경 → 파일을 쓰는 모든 테스트
+    assert affected_tests(_impact_map(), {"src/app/core.py": {1}}) == every_core_test
+    assert affected_tests(_impact_map(), {"src/app/core.py": None}) == every_core_test
+    # 커밋되지 않은 소스로 만든 맵은 라인 번호를 믿을 수 없어 파일 단위로 선택
+    assert affected_tests(_impact_map(dirty=True), {"src/app/core.py": {5}}) == every_core_test
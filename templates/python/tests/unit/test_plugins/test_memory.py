@@ -0,0 +1,154 @@
+"""
+plugins.memory 단위 테스트
+
+pytester로 --memory 세션을 실행해 retained/peak 계산, 픽스처 측정, leak 재실행, xdist 결과 병합을 검사합니다.
+"""
+
+import json
+
+import pytest
+
+KIB = 1024
+
+TESTS = """
+import pytest
+
+KEPT = []
+
+
+@pytest.fixture(scope="module")
+def module_buffer():
+    buffer = bytearray(512 * 1024)
+    yield buffer
+    del buffer
+
+
+def test_keeps_memory():
+    KEPT.append(bytearray(256 * 1024))
+
+
+def test_temporary_peak():
+    data = bytearray(1024 * 1024)
+    del data
+
+
+def test_uses_module_fixture(module_buffer):
+    assert len(module_buffer) == 512 * 1024
+
+
+def test_cyclic_garbage():
+    cycle = [bytearray(256 * 1024)]
+    cycle.append(cycle)
+"""
+
+FLAKY_RERUN = """
+CALLS = []
+KEPT = []
+
+
+def test_leaks_once():
+    CALLS.append(1)
+    KEPT.append(bytearray(256 * 1024))
+    assert len(CALLS) == 1, "fixture state does not allow reruns"
+"""
+
+
+@pytest.fixture
+def memory_pytester(use_plugins):
+    return use_plugins("plugins.timing", "plugins.memory")
+
+
+def _report(pytester, *args):
+    result = pytester.runpytest("--memory", "--memory-report=memory.json", *args)
+    report = json.loads((pytester.path / "memory.json").read_text(encoding="utf-8"))
+    return result, report
+
+
+def test_retained_and_peak_per_test(memory_pytester):
+    memory_pytester.makepyfile(test_usage=TESTS)
+
+    result, report = _report(memory_pytester)
+
+    result.assert_outcomes(passed=4)
+    tests = report["tests"]
+    kept = tests["test_usage.py::test_keeps_memory"]
+    assert kept["retained"] >= 200 * KIB
+    assert kept["call_retained"] >= 200 * KIB
+    assert kept["leak_candidate"] is True
+    peak = tests["test_usage.py::test_temporary_peak"]
+    assert peak["peak"] >= 900 * KIB
+    assert peak["retained"] < 64 * KIB
+    assert "leak_candidate" not in peak
+    # 임계값을 넘으면 gc 후 다시 계산하므로 순환 참조 garbage는 leak 후보가 아님
+    assert "leak_candidate" not in tests["test_usage.py::test_cyclic_garbage"]
+    # 모듈 픽스처의 setup 메모리는 픽스처에 기록되고 처음 사용한 테스트의 retained에서 제외됨
+    assert tests["test_usage.py::test_uses_module_fixture"]["retained"] < 64 * KIB
+    (fixture,) = [
+        record for record in report["fixtures"].values() if record["name"] == "module_buffer"
+    ]
+    assert fixture["setup_retained"] >= 400 * KIB
+    assert fixture["teardown_retained"] < 64 * KIB
+    assert report["leak_candidates"] == ["test_usage.py::test_keeps_memory"]
+    result.stdout.fnmatch_lines(
+        ["*leak candidates*--memory-leak-runs=3*", "*test_usage.py::test_keeps_memory"]
+    )
+
+
+def test_leak_runs_confirm_leak(memory_pytester):
+    memory_pytester.makepyfile(test_usage=TESTS)
+
+    result, report = _report(memory_pytester, "--memory-leak-runs=2")
+
+    record = report["tests"]["test_usage.py::test_keeps_memory"]
+    assert len(record["leak_runs"]) == 2
+    assert all(retained >= 200 * KIB for retained in record["leak_runs"])
+    assert report["leaks"] == ["test_usage.py::test_keeps_memory"]
+    assert report["leak_candidates"] == []
+    result.stdout.fnmatch_lines(["*possible leaks*2 reruns*", "*test_usage.py::test_keeps_memory*"])
+
+
+def test_failed_leak_rerun_is_reported(memory_pytester):
+    memory_pytester.makepyfile(test_flaky=FLAKY_RERUN)
+
+    result, report = _report(memory_pytester, "--memory-leak-runs=2")
+
+    # 재실행 실패는 테스트 결과에 영향을 주지 않고 leak 후보/leak으로도 판정하지 않음
+    result.assert_outcomes(passed=1)
+    nodeid = "test_flaky.py::test_leaks_once"
+    assert (
+        "AssertionError: fixture state does not allow reruns"
+        in (report["tests"][nodeid]["leak_check_error"])
+    )
+    assert report["leak_check_errors"] == [nodeid]
+    assert report["leak_candidates"] == report["leaks"] == []
+    result.stdout.fnmatch_lines(
+        [
+            "*leak check failed (rerun raised, not judged)*",
+            f"*{nodeid}",
+            "*AssertionError: fixture state does not allow reruns*",
+        ]
+    )
+    result.stdout.no_fnmatch_line("*leak candidates*")
+
+
+def test_xdist_workers_are_merged(memory_pytester):
+    memory_pytester.makepyfile(test_usage=TESTS)
+
+    result, report = _report(memory_pytester, "-n", "2")
+
+    result.assert_outcomes(passed=4)
+    assert set(report["tests"]) == {
+        "test_usage.py::test_keeps_memory",
+        "test_usage.py::test_temporary_peak",
+        "test_usage.py::test_uses_module_fixture",
+        "test_usage.py::test_cyclic_garbage",
+    }
+    assert report["tests"]["test_usage.py::test_keeps_memory"]["leak_candidate"] is True
+    assert set(report["sessions"]) <= {"gw0", "gw1"}
+    assert report["sessions"]
+    (fixture_key,) = [
+        key for key, record in report["fixtures"].items() if record["name"] == "module_buffer"
+    ]
+    worker = report["fixtures"][fixture_key]["worker"]
+    assert fixture_key.startswith(f"{worker}:")
+    result.stdout.fnmatch_lines(["*memory*", "gw*: traced at end*"])
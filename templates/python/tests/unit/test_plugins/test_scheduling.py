@@ -0,0 +1,158 @@
+"""
+plugins.scheduling 단위 테스트
+
+작업 단위 그룹화, 예상 시간 순 배정, history가 없는 테스트의 예상 시간, makespan 계산을 검사하고
+xdist 내부 API에 의존하므로 pytester로 -n 2 실행을 함께 검사합니다.
+"""
+
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+from plugins.scheduling import DurationSchedulePlugin, DurationScheduling, simulate_makespan
+from plugins.timing import HISTORY_VERSION
+
+HISTORY = {
+    "tests/unit/test_a.py::test_five": {"call": [5.0]},
+    "tests/unit/test_a.py::test_one": {"call": [1.0]},
+    "tests/integration/test_db.py::test_read": {"setup": [0.5], "call": [1.5]},
+    "tests/integration/test_db.py::test_write": {"call": [2.0]},
+}
+COLLECTION = [
+    "tests/unit/test_a.py::test_one",
+    "tests/integration/test_db.py::test_read",
+    "tests/unit/test_a.py::test_five",
+    "tests/unit/test_b.py::test_new",
+    "tests/integration/test_db.py::test_write",
+]
+
+GROUP_TESTS = """
+import os
+
+
+def test_first():
+    assert os.environ["PYTEST_XDIST_WORKER"]
+
+
+def test_second():
+    assert os.environ["PYTEST_XDIST_WORKER"]
+"""
+
+
+class FakeNode:
+    """xdist WorkerController 대신 배정된 테스트를 기록"""
+
+    def __init__(self, name, sent):
+        self.gateway = SimpleNamespace(id=name)
+        self.shutting_down = False
+        self.sent = sent
+
+    def send_runtest_some(self, indexes):
+        self.sent.append((self.gateway.id, [COLLECTION[index] for index in indexes]))
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+@pytest.fixture
+def schedule_config(use_plugins):
+    pytester = use_plugins(
+        "plugins.timing",
+        "plugins.scheduling",
+        duration_schedule_groups="\n    tests/integration/\n    tests/e2e",
+    )
+    history = {"version": HISTORY_VERSION, "tests": HISTORY, "fixtures": {}}
+    (pytester.path / ".pytest-timings.json").write_text(json.dumps(history), encoding="utf-8")
+    return pytester.parseconfig("--tx=2*popen", "--duration-schedule")
+
+
+def test_split_scope_groups_by_directory(schedule_config):
+    scheduler = DurationScheduling(schedule_config, groups=["tests/integration/", "tests/e2e"])
+
+    assert scheduler._split_scope("tests/integration/test_db.py::test_read") == "tests/integration"
+    assert scheduler._split_scope("tests/integration/sub/test_x.py::test") == "tests/integration"
+    assert scheduler._split_scope("tests/integration::test_module_level") == "tests/integration"
+    # 접두사만 같은 다른 디렉토리는 묶지 않음
+    assert scheduler._split_scope("tests/integration_extra/test_x.py::test") == (
+        "tests/integration_extra/test_x.py::test"
+    )
+    assert scheduler._split_scope("tests/unit/test_a.py::test_one") == (
+        "tests/unit/test_a.py::test_one"
+    )
+
+
+def test_estimate_falls_back_to_median(schedule_config):
+    plugin = DurationSchedulePlugin(schedule_config)
+
+    assert plugin.estimate("tests/unit/test_a.py::test_five") == 5.0
+    assert plugin.estimate("tests/integration/test_db.py::test_read") == 2.0
+    # history에 없는 테스트: 기록된 테스트 예상 시간(5, 1, 2, 2)의 중앙값
+    assert plugin.estimate("tests/unit/test_b.py::test_new") == 2.0
+
+
+def test_workqueue_is_longest_first(schedule_config):
+    plugin = DurationSchedulePlugin(schedule_config)
+    scheduler = DurationScheduling(schedule_config, estimate=plugin.estimate, groups=plugin.groups)
+    sent: list[tuple[str, list[str]]] = []
+    nodes = [FakeNode("gw0", sent), FakeNode("gw1", sent)]
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, COLLECTION)
+
+    scheduler.schedule()
+
+    assert scheduler.unit_estimates == {
+        "tests/unit/test_a.py::test_five": 5.0,
+        "tests/integration": 4.0,
+        "tests/unit/test_b.py::test_new": 2.0,
+        "tests/unit/test_a.py::test_one": 1.0,
+    }
+    # 긴 작업 단위부터 워커에 배정, 그룹은 한 워커에 통째로
+    assert sent[:2] == [
+        ("gw0", ["tests/unit/test_a.py::test_five"]),
+        (
+            "gw1",
+            ["tests/integration/test_db.py::test_read", "tests/integration/test_db.py::test_write"],
+        ),
+    ]
+    # 실행 중인 테스트가 하나뿐인 워커에는 다음 작업 단위를 미리 배정
+    assert sent[2:] == [("gw0", ["tests/unit/test_b.py::test_new"])]
+    assert list(scheduler.workqueue) == ["tests/unit/test_a.py::test_one"]
+
+    scheduler.mark_test_complete(nodes[0], COLLECTION.index("tests/unit/test_a.py::test_five"))
+
+    assert sent[3:] == [("gw0", ["tests/unit/test_a.py::test_one"])]
+    assert not scheduler.workqueue
+
+
+def test_simulate_makespan():
+    assert simulate_makespan([5.0, 4.0, 2.0, 1.0], 2) == [6.0, 6.0]
+    assert simulate_makespan([1.0, 2.0, 4.0, 5.0], 2) == [7.0, 5.0]
+    assert simulate_makespan([1.0, 2.0], 0) == [3.0]
+    assert simulate_makespan([], 3) == [0.0, 0.0, 0.0]
+
+
+def test_xdist_run_keeps_group_on_one_worker(use_plugins):
+    pytester = use_plugins("plugins.timing", "plugins.scheduling")
+    pytester.mkpydir("tests")
+    for directory in ("tests/integration", "tests/unit"):
+        pytester.mkpydir(directory)
+    (pytester.path / "tests/integration/test_group.py").write_text(GROUP_TESTS, encoding="utf-8")
+    (pytester.path / "tests/unit/test_units.py").write_text(GROUP_TESTS, encoding="utf-8")
+
+    result = pytester.runpytest("-n", "2", "--duration-schedule", "-v")
+
+    result.assert_outcomes(passed=4)
+    workers = {
+        match.group(2): match.group(1)
+        for match in re.finditer(r"\[(gw\d+)\] .*PASSED (\S+)", result.stdout.str())
+    }
+    assert len(workers) == 4
+    group_workers = {
+        workers[nodeid] for nodeid in workers if nodeid.startswith("tests/integration/")
+    }
+    assert len(group_workers) == 1
+    result.stdout.fnmatch_lines(
+        ["*duration-aware scheduling*", "*mean utilization*", "*predicted makespan*"]
+    )
@@ -0,0 +1,142 @@
+"""
+plugins.timing 단위 테스트
+
+pytester로 history 기반 slow 마커 자동 적용, 마커 제안, regression 표시, history 보관 수, xdist 픽스처 시간 병합을 검사합니다.
+"""
+
+import json
+
+import pytest
+from plugins.timing import HISTORY_VERSION
+
+TESTS = """
+import time
+
+import pytest
+
+
+def test_quick():
+    pass
+
+
+def test_sleepy():
+    time.sleep(0.1)
+
+
+@pytest.mark.slow
+def test_marked_but_fast():
+    pass
+"""
+
+FIXTURE_TESTS = """
+import pytest
+
+
+@pytest.fixture(scope="session")
+def resource():
+    yield "resource"
+
+
+@pytest.mark.parametrize("n", range(4))
+def test_uses_resource(resource, n):
+    assert resource == "resource"
+"""
+
+
+@pytest.fixture
+def timing_pytester(use_plugins):
+    pytester = use_plugins(
+        "plugins.timing",
+        markers="slow: 느린 테스트",
+        timing_slow_threshold="0.05",
+        timing_history_size="3",
+    )
+    pytester.makepyfile(test_durations=TESTS)
+    return pytester
+
+
+def _history_file(pytester):
+    return pytester.path / ".pytest-timings.json"
+
+
+def _write_history(pytester, tests):
+    payload = {"version": HISTORY_VERSION, "tests": tests, "fixtures": {}}
+    _history_file(pytester).write_text(json.dumps(payload), encoding="utf-8")
+
+
+def _read_history(pytester):
+    return json.loads(_history_file(pytester).read_text(encoding="utf-8"))
+
+
+def test_auto_slow_marker_applies_before_deselection(timing_pytester):
+    _write_history(timing_pytester, {"test_durations.py::test_quick": {"call": [1.0, 1.0]}})
+
+    result = timing_pytester.runpytest("-m", "not slow")
+
+    # history 중앙값이 임계값 이상인 test_quick은 -m "not slow"에서 제외됨
+    result.assert_outcomes(passed=1, deselected=2)
+    result.stdout.fnmatch_lines(["auto slow marker (history >= 0.05s): 1 test(s)"])
+
+
+def test_suggests_adding_and_removing_slow_marker(timing_pytester):
+    result = timing_pytester.runpytest()
+
+    result.assert_outcomes(passed=3)
+    result.stdout.fnmatch_lines(
+        [
+            "slow 마커 추가 제안 (call >= 0.05s):",
+            "*test_durations.py::test_sleepy",
+            "slow 마커 해제 제안 (call < 0.05s):",
+            "*test_durations.py::test_marked_but_fast",
+        ]
+    )
+
+
+def test_regression_against_previous_median(timing_pytester):
+    _write_history(
+        timing_pytester, {"test_durations.py::test_sleepy": {"call": [0.01, 0.01, 0.02]}}
+    )
+
+    result = timing_pytester.runpytest("--no-timing-history")
+
+    result.stdout.fnmatch_lines(
+        ["regressions (>= 2x previous median):", "*0.01s ->*test_durations.py::test_sleepy"]
+    )
+    result.stdout.no_fnmatch_line("*test_quick*->*")
+    # --no-timing-history: history는 그대로
+    assert _read_history(timing_pytester)["tests"]["test_durations.py::test_sleepy"]["call"] == [
+        0.01,
+        0.01,
+        0.02,
+    ]
+
+
+def test_history_is_trimmed_to_size(timing_pytester):
+    _write_history(timing_pytester, {"test_durations.py::test_quick": {"call": [9, 8, 7, 6, 5]}})
+
+    timing_pytester.runpytest().assert_outcomes(passed=3)
+
+    tests = _read_history(timing_pytester)["tests"]
+    quick = tests["test_durations.py::test_quick"]["call"]
+    assert quick[:2] == [6, 5]
+    assert len(quick) == 3
+    assert quick[-1] < 0.05
+    assert set(tests["test_durations.py::test_sleepy"]) == {"setup", "call", "teardown"}
+
+
+def test_xdist_worker_fixture_timings_are_merged(use_plugins):
+    pytester = use_plugins("plugins.timing")
+    pytester.makepyfile(test_fixtures=FIXTURE_TESTS)
+
+    result = pytester.runpytest("-n", "2")
+
+    result.assert_outcomes(passed=4)
+    # 세션 픽스처는 워커마다 한 번씩 setup됨
+    result.stdout.fnmatch_lines(
+        ["slowest fixtures (setup + teardown, total):", "*resource [[]session] x2"]
+    )
+    history = _read_history(pytester)
+    resource = history["fixtures"]["test_fixtures.py::resource"]
+    assert resource["scope"] == "session"
+    assert len(resource["setup"]) == len(resource["teardown"]) == 1
+    assert len(history["tests"]) == 4